@@ -0,0 +1,60 @@
+"""
+Per-event cost of parsing timetable cell strings.
+
+Parses every event-looking cell of a timetable through `Event.from_string`
+repeatedly and prints the mean cost per event.
+
+    python -m benchmarks.bench_event_strings [timetable.xlsx] [rounds]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+from jiit_tt_parser.parser.parse_courses import parse_courses
+from jiit_tt_parser.parser.parse_events import (EVENT_HEAD_RE, Event, Period,
+                                                SubjectIndex)
+from jiit_tt_parser.utils.grid import load_grid
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def collect_event_strings(sheet) -> list[str]:
+    ev_strs = []
+    for row in sheet.values:
+        for v in row:
+            if v is not None and EVENT_HEAD_RE.search(str(v)):
+                ev_strs.append(str(v).replace("\xa0", " ").replace("\n", " ").strip())
+    return ev_strs
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        ROOT, "bca_sem_1_3_new.xlsx"
+    )
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    sheet = load_grid(path)
+    courses = parse_courses(sheet, sheet.rows, sheet.cols)
+    courses["super_secret_key"] = dict(courses)
+    courses = SubjectIndex(courses)
+    ev_strs = collect_event_strings(sheet)
+    period = Period()
+
+    with contextlib.redirect_stdout(io.StringIO()) as sink:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for ev_str in ev_strs:
+                Event.from_string(ev_str.upper(), period, "monday", courses, {})
+                sink.seek(0)
+                sink.truncate()
+        elapsed = time.perf_counter() - start
+
+    n = rounds * len(ev_strs)
+    print(f"{len(ev_strs)} event strings x {rounds} rounds")
+    print(f"{elapsed / n * 1e6:.2f} us/event")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Startup cost of importing the package.
+
+Runs each import in a fresh interpreter, repeatedly, and prints the best
+wall time of each next to the heavy dependencies it pulled in. Exits with
+status 1 if a gated import (`import jiit_tt_parser`, or pulling `Period`
+out of the parser) is slower than its budget or loads any of those
+dependencies, so it can gate CI. `scale` multiplies every budget, for slow
+machines.
+
+    python -m benchmarks.bench_import_time [scale] [rounds]
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# import statement -> budget in ms on top of the interpreter's startup, or
+# None for imports that are only reported
+IMPORTS = {
+    "import jiit_tt_parser": 30.0,
+    "import jiit_tt_parser.utils": None,
+    "import jiit_tt_parser.parser": None,
+    # the parse_events module, without openpyxl
+    "from jiit_tt_parser.parser import Period": 150.0,
+    "from jiit_tt_parser.parser.pipeline import TimetablePipeline": None,
+    "from jiit_tt_parser.utils.grid import SheetGrid": None,
+}
+HEAVY = ("openpyxl", "requests", "pandas", "numpy")
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+took = time.perf_counter() - start
+print(took * 1000, *(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def time_import(statement: str, rounds: int) -> tuple[float, list[str]]:
+    """Best wall time in ms of `statement`, and the heavy modules it loaded."""
+    best, loaded = float("inf"), []
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    for _ in range(rounds):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=statement, heavy=HEAVY)],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+        ).stdout.split()
+        best, loaded = min(best, float(out[0])), out[1:]
+    return best, loaded
+
+
+def main():
+    scale = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    over = []
+    for statement, budget in IMPORTS.items():
+        took, loaded = time_import(statement, rounds)
+        print(f"{statement:62} {took:8.2f} ms  {' '.join(loaded) or '-'}")
+        if budget is not None and (took > budget * scale or loaded):
+            over.append((statement, took, budget * scale, loaded))
+
+    for statement, took, budget, loaded in over:
+        print(
+            f"{statement}: {took:.2f} ms (budget {budget:.2f} ms), "
+            f"loaded: {', '.join(loaded) or '-'}"
+        )
+    if over:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,17 @@
+from jiit_tt_parser.utils.lazy import lazy_exports
 
+# imported on first access, importing the package itself loads neither
+# openpyxl nor any of the parsers
+_LAZY = {
+    "parse_events": "jiit_tt_parser.parser.parse_events",
+    "Event": "jiit_tt_parser.parser.parse_events",
+    "Elective": "jiit_tt_parser.parser.parse_events",
+    "Period": "jiit_tt_parser.parser.parse_events",
+    "TimetablePipeline": "jiit_tt_parser.parser.pipeline",
+    "SheetGrid": "jiit_tt_parser.utils.grid",
+    "load_grid": "jiit_tt_parser.utils.grid",
+}
 
+__all__ = list(_LAZY)
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
@@ -0,0 +1,126 @@
+import argparse
+import datetime
+
+from jiit_tt_parser.utils import PROG
+
+# kept here so --help doesn't import the exporter
+FEED_KINDS = ("batch", "faculty", "room")
+
+
+def add_parse_arguments(p: argparse.ArgumentParser):
+    p.add_argument("paths", nargs="+", help="timetable .xlsx files")
+    add_map_arguments(p)
+
+
+def add_map_arguments(p: argparse.ArgumentParser):
+    p.add_argument("-f", "--faculty", required=True, help="faculty map json")
+    p.add_argument(
+        "-c", "--curriculum", default="curriculum.json", help="curriculum map json"
+    )
+    p.add_argument(
+        "-j", "--jobs", type=int, default=None, help="worker processes (default: cpus)"
+    )
+
+
+def cmd_parse(args: argparse.Namespace):
+    from jiit_tt_parser.parser.parse_many import parse_many
+
+    for path, events in parse_many(
+        args.paths, args.faculty, args.curriculum, workers=args.jobs
+    ):
+        print(f"# {path}: {len(events)} events")
+        print(*events, sep="\n")
+
+
+def cmd_clashes(args: argparse.Namespace):
+    from jiit_tt_parser.parser.parse_many import parse_many
+    from jiit_tt_parser.query.clashes import find_clashes
+
+    events = []
+    for _, sheet_events in parse_many(
+        args.paths, args.faculty, args.curriculum, workers=args.jobs
+    ):
+        events.extend(sheet_events)
+
+    clashes = find_clashes(events)
+    for clash in clashes:
+        print(clash)
+    print(f"# {len(clashes)} clashes in {len(events)} events")
+
+
+def cmd_diff(args: argparse.Namespace):
+    from jiit_tt_parser.parser.parse_many import parse_many
+    from jiit_tt_parser.query.diff import diff_timetables
+
+    parsed = dict(
+        parse_many(
+            [args.old, args.new], args.faculty, args.curriculum, workers=args.jobs
+        )
+    )
+    diff = diff_timetables(parsed[args.old], parsed[args.new])
+    for change in diff:
+        print(change)
+    print(f"# {len(diff)} changes for {len(diff.affected_batches())} batches")
+
+
+def cmd_ics(args: argparse.Namespace):
+    from jiit_tt_parser.export.ics import export_ics
+    from jiit_tt_parser.parser.parse_many import parse_many
+
+    events = []
+    for _, sheet_events in parse_many(
+        args.paths, args.faculty, args.curriculum, workers=args.jobs
+    ):
+        events.extend(sheet_events)
+
+    paths = export_ics(
+        events, args.out, args.by or FEED_KINDS, start=args.start, until=args.until
+    )
+    print(f"# {len(paths)} feeds written to {args.out}")
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        prog=PROG, description="Parse JIIT Time Table Spreadsheets"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name, func, help in (
+        ("parse", cmd_parse, "parse one or more timetables"),
+        ("clashes", cmd_clashes, "find room, lecturer and batch clashes"),
+    ):
+        p = commands.add_parser(name, help=help)
+        add_parse_arguments(p)
+        p.set_defaults(func=func)
+
+    p = commands.add_parser("diff", help="compare two versions of a timetable")
+    p.add_argument("old", help="previous timetable .xlsx")
+    p.add_argument("new", help="revised timetable .xlsx")
+    add_map_arguments(p)
+    p.set_defaults(func=cmd_diff)
+
+    p = commands.add_parser("ics", help="export iCalendar feeds")
+    add_parse_arguments(p)
+    p.add_argument("-o", "--out", default="ics", help="output directory")
+    p.add_argument(
+        "--by",
+        action="append",
+        choices=FEED_KINDS,
+        help="feeds to write, repeatable (default: all)",
+    )
+    p.add_argument(
+        "--start",
+        type=datetime.date.fromisoformat,
+        help="first week, YYYY-MM-DD (default: today)",
+    )
+    p.add_argument(
+        "--until", type=datetime.date.fromisoformat, help="last day, YYYY-MM-DD"
+    )
+    p.set_defaults(func=cmd_ics)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
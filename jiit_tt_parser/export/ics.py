@@ -0,0 +1,267 @@
+import datetime
+import hashlib
+import os
+import re
+from typing import Iterable, List, TextIO
+
+from jiit_tt_parser.parser.parse_events import (Elective, Event,
+                                                days_of_the_week_names)
+from jiit_tt_parser.query.index import batch_category
+from jiit_tt_parser.utils import PROG
+
+FEED_KINDS = ("batch", "faculty", "room")
+
+EVENT_TYPES = {"L": "Lecture", "T": "Tutorial", "P": "Practical", "TALK": "Talk"}
+
+BYDAY = {day.capitalize(): day[:2].upper() for day in days_of_the_week_names}
+WEEKDAYS = {day.capitalize(): i for i, day in enumerate(days_of_the_week_names)}
+
+# timetables are in IST, which has no daylight saving to describe
+TZID = "Asia/Kolkata"
+VTIMEZONE = [
+    "BEGIN:VTIMEZONE",
+    f"TZID:{TZID}",
+    "BEGIN:STANDARD",
+    "DTSTART:19700101T000000",
+    "TZOFFSETFROM:+0530",
+    "TZOFFSETTO:+0530",
+    "TZNAME:IST",
+    "END:STANDARD",
+    "END:VTIMEZONE",
+]
+
+UNSAFE_FILENAME_RE = re.compile(r"[^\w.-]+")
+
+
+def escape_text(text: str) -> str:
+    """Escape a TEXT value as RFC 5545 3.3.11 asks."""
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def fold(line: str) -> str:
+    """Fold a content line into 75 octet pieces, RFC 5545 3.1."""
+    raw = line.encode()
+    if len(raw) <= 75:
+        return line + "\r\n"
+
+    pieces = []
+    start, limit = 0, 75
+    while start < len(raw):
+        end = min(start + limit, len(raw))
+        # don't split a utf-8 sequence
+        while end < len(raw) and raw[end] & 0xC0 == 0x80:
+            end -= 1
+        pieces.append(raw[start:end].decode())
+        start, limit = end, 74  # continuation lines start with a space
+    return "\r\n ".join(pieces) + "\r\n"
+
+
+def group_events(
+    events: Iterable[Event | Elective], kinds: Iterable[str] = FEED_KINDS
+) -> dict[tuple[str, str], List[Event | Elective]]:
+    """
+    The events of every feed, keyed by (kind, name), in one pass over
+    `events`. Electives offered to whole batch categories join the feed of
+    every batch of those categories.
+    """
+    kinds = tuple(kinds)
+    feeds: dict[tuple[str, str], list] = {}
+    batch_cats: dict[str, list] = {}
+    for ev in events:
+        if "batch" in kinds:
+            for batch in dict.fromkeys(ev.batches):
+                feeds.setdefault(("batch", batch), []).append(ev)
+            if isinstance(ev, Elective):
+                for cat in dict.fromkeys(ev.batch_cats):
+                    batch_cats.setdefault(cat, []).append(ev)
+        if "faculty" in kinds:
+            for name in dict.fromkeys(ev.lecturer):
+                if name:
+                    feeds.setdefault(("faculty", name), []).append(ev)
+        if "room" in kinds and ev.classroom:
+            feeds.setdefault(("room", ev.classroom), []).append(ev)
+
+    if batch_cats:
+        for (kind, batch), feed in feeds.items():
+            if kind == "batch":
+                feed.extend(
+                    ev
+                    for ev in batch_cats.get(batch_category(batch), ())
+                    if batch not in ev.batches
+                )
+
+    return feeds
+
+
+def first_date(start: datetime.date, day: str) -> datetime.date | None:
+    """The first `day` of the week on or after `start`."""
+    weekday = WEEKDAYS.get(day)
+    if weekday is None:
+        return None
+    return start + datetime.timedelta(days=(weekday - start.weekday()) % 7)
+
+
+def event_uid(ev: Event | Elective) -> str:
+    h = hashlib.blake2b(digest_size=12)
+    h.update(
+        repr(
+            (
+                ev.day,
+                ev.period.start,
+                ev.period.end,
+                ev.event_type,
+                ev.eventcode,
+                ev.classroom,
+                ev.batches,
+            )
+        ).encode()
+    )
+    return f"{h.hexdigest()}@{PROG}"
+
+
+def render_event(
+    ev: Event | Elective,
+    start: datetime.date,
+    until: datetime.date | None,
+    stamp: str,
+) -> str:
+    """The folded VEVENT lines of `ev`, empty for events without a weekday."""
+    date = first_date(start, ev.day)
+    if date is None:
+        return ""
+
+    fmt = "%Y%m%dT%H%M%S"
+    begin = datetime.datetime.combine(date, ev.period.start_time)
+    end = datetime.datetime.combine(date, ev.period.end_time)
+    rrule = f"FREQ=WEEKLY;BYDAY={BYDAY[ev.day]}"
+    if until is not None:
+        # UNTIL is UTC when DTSTART has a TZID, the last day's end suffices
+        rrule += f";UNTIL={until.strftime('%Y%m%d')}T235959Z"
+
+    kind = EVENT_TYPES.get(ev.event_type, ev.event_type)
+    summary = escape_text(f"{ev.event or ev.eventcode} ({kind})")
+    description = [f"Code: {ev.eventcode}"]
+    if ev.lecturer:
+        description.append(f"Lecturer: {', '.join(ev.lecturer)}")
+    if ev.batches:
+        description.append(f"Batches: {', '.join(ev.batches)}")
+    if isinstance(ev, Elective):
+        description.append(f"Category: {ev.category}")
+    description = escape_text("\n".join(description))
+
+    return "".join(
+        map(
+            fold,
+            (
+                "BEGIN:VEVENT",
+                f"UID:{event_uid(ev)}",
+                f"DTSTAMP:{stamp}",
+                f"DTSTART;TZID={TZID}:{begin.strftime(fmt)}",
+                f"DTEND;TZID={TZID}:{end.strftime(fmt)}",
+                f"RRULE:{rrule}",
+                f"SUMMARY:{summary}",
+                f"LOCATION:{escape_text(ev.classroom)}",
+                f"DESCRIPTION:{description}",
+                "END:VEVENT",
+            ),
+        )
+    )
+
+
+def write_ics(
+    out: TextIO,
+    events: Iterable[Event | Elective],
+    name: str,
+    start: datetime.date | None = None,
+    until: datetime.date | None = None,
+    rendered: dict[int, str] | None = None,
+):
+    """
+    Write `events` to `out` as one calendar, a weekly recurring VEVENT each,
+    first occurring on the event's day on or after `start` (today if None)
+    and repeating until `until` if given. Every event is written as soon as
+    it is rendered; open `out` with newline="" so the CRLFs are kept.
+
+    `rendered` memoizes the VEVENT of each event by id(), pass the same dict
+    when writing many feeds that share events.
+    """
+    start = start or datetime.date.today()
+    stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    if rendered is None:
+        rendered = {}
+
+    for line in (
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:-//{PROG}//EN",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{escape_text(name)}",
+        f"X-WR-TIMEZONE:{TZID}",
+        *VTIMEZONE,
+    ):
+        out.write(fold(line))
+    for ev in events:
+        block = rendered.get(id(ev))
+        if block is None:
+            block = rendered[id(ev)] = render_event(ev, start, until, stamp)
+        out.write(block)
+    out.write("END:VCALENDAR\r\n")
+
+
+def feed_filenames(feeds) -> dict[tuple[str, str], str]:
+    """
+    `{kind}-{name}.ics` for every (kind, name) of `feeds`, with the unsafe
+    characters of the name replaced. Names that come out the same, like
+    "CL15/CL16" and "CL15,CL16" (or "CL15" and "cl15" on a case-insensitive
+    filesystem), get a short hash of the raw name appended, so no feed
+    overwrites another.
+    """
+    stems = {
+        (kind, name): f"{kind}-{UNSAFE_FILENAME_RE.sub('_', name)}"
+        for kind, name in feeds
+    }
+    counts: dict[str, int] = {}
+    for stem in stems.values():
+        counts[stem.lower()] = counts.get(stem.lower(), 0) + 1
+
+    filenames = {}
+    for (kind, name), stem in stems.items():
+        if counts[stem.lower()] > 1:
+            digest = hashlib.blake2b(name.encode(), digest_size=4).hexdigest()
+            stem = f"{stem}-{digest}"
+        filenames[(kind, name)] = f"{stem}.ics"
+    return filenames
+
+
+def export_ics(
+    events: Iterable[Event | Elective],
+    out_dir: str,
+    kinds: Iterable[str] = FEED_KINDS,
+    start: datetime.date | None = None,
+    until: datetime.date | None = None,
+) -> List[str]:
+    """
+    Write a `{kind}-{name}.ics` feed into `out_dir` for every batch,
+    faculty and room (or just `kinds`) of `events`, named by
+    `feed_filenames`. Events are grouped once and rendered once, then each
+    feed is streamed to its file. Returns the paths written.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    start = start or datetime.date.today()
+    rendered: dict[int, str] = {}
+    feeds = group_events(events, kinds)
+    paths = []
+    for (kind, name), filename in feed_filenames(feeds).items():
+        feed = feeds[(kind, name)]
+        path = os.path.join(out_dir, filename)
+        with open(path, "w", encoding="utf-8", newline="") as out:
+            write_ics(
+                out, feed, f"{kind.capitalize()} {name}", start, until, rendered
+            )
+        paths.append(path)
+    return paths
@@ -1 +1,16 @@
-from jiit_tt_parser.parser.parse_events import parse_events
+# parse_events is imported eagerly, as it always was: the function has to
+# be bound here after its submodule of the same name, or importing the
+# submodule would leave the module in its place
+from jiit_tt_parser.parser.parse_events import (Elective, Event, Period,
+                                                lookup_sub, parse_events)
+from jiit_tt_parser.utils.lazy import lazy_exports
+
+# imported on first access
+_LAZY = {
+    "parse_legends": "jiit_tt_parser.parser.legends",
+    "TimetablePipeline": "jiit_tt_parser.parser.pipeline",
+}
+
+__all__ = ["parse_events", "Event", "Elective", "Period", "lookup_sub", *_LAZY]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
@@ -0,0 +1,182 @@
+import hashlib
+import json
+import os
+import re
+from typing import Iterable
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(__file__), "event_rules.json")
+
+
+class EventRules:
+    """
+    Typo fixups and elective code lists for raw event strings.
+
+    The rules are data, see `event_rules.json` for the shipped set and its
+    layout. A fixup either `find`s a literal, replacing it, replacing the
+    `whole` string or, with `drop`, dropping the string, or matches a regex
+    `pattern`.
+
+    Fixups run once each, in file order, and each sees the output of the
+    ones before it, exactly like a chain of `if find in s: s = ...`. A
+    fixup meant for another's output has to come after it.
+
+    Every elective code, literal and pattern is compiled into one
+    alternation, with the literals folded into a trie so a position is
+    rejected on its first character. A string that search finds nothing in,
+    nearly every cell, needs no further work.
+    """
+
+    def __init__(
+        self, electives: list[dict] | None = None, fixups: list[dict] | None = None
+    ) -> None:
+        self.electives = electives or []
+        self.fixups = fixups or []
+
+        # code -> index of its category, lower wins when a string has several
+        self._categories = [e["category"] for e in self.electives]
+        self._elective_ranks: dict[str, int] = {}
+        for i, elective in enumerate(self.electives):
+            for code in elective["codes"]:
+                self._elective_ranks.setdefault(code, i)
+        self._elective_re = None
+        if self._elective_ranks:
+            self._elective_re = re.compile(_trie_pattern(self._elective_ranks))
+
+        # (find, replacement, whole), a None replacement drops the string,
+        # or (compiled pattern, replacement, None)
+        self._steps: list[tuple] = []
+        literals = list(self._elective_ranks)
+        patterns = []
+        for fixup in self.fixups:
+            if "pattern" in fixup:
+                pattern = re.compile(fixup["pattern"])
+                self._steps.append((pattern, fixup["replace"], None))
+                patterns.append(f"(?:{fixup['pattern']})")
+                continue
+            replacement = None if fixup.get("drop") else fixup["replace"]
+            self._steps.append((fixup["find"], replacement, fixup.get("whole", False)))
+            literals.append(fixup["find"])
+
+        # patterns last, an anchored one would otherwise be tried first at
+        # every position
+        alternatives = ([_trie_pattern(literals)] if literals else []) + patterns
+        self._scan_re = re.compile("|".join(alternatives)) if alternatives else None
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_RULES_PATH):
+        """Load rules from a json file, or a toml file on python 3.11+."""
+        if path.endswith(".toml"):
+            import tomllib
+
+            with open(path, "rb") as f:
+                data = tomllib.load(f)
+        else:
+            with open(path) as f:
+                data = json.load(f)
+
+        return cls(data.get("electives"), data.get("fixups"))
+
+    def classify(self, ev_str: str) -> tuple[str | None, str | None]:
+        """
+        (elective category, None) if `ev_str` is an elective, else (None,
+        `normalize(ev_str)`), from one scan of the string when no rule
+        applies.
+        """
+        if self._scan_re is None or self._scan_re.search(ev_str) is None:
+            return None, ev_str
+        category = self._category(ev_str)
+        if category is not None:
+            return category, None
+        return None, self._fix(ev_str)
+
+    def elective_category(self, ev_str: str) -> str | None:
+        if self._scan_re is None or self._scan_re.search(ev_str) is None:
+            return None
+        return self._category(ev_str)
+
+    def normalize(self, ev_str: str) -> str | None:
+        """Apply the fixups to `ev_str`, or return None if it is to be dropped."""
+        if self._scan_re is None or self._scan_re.search(ev_str) is None:
+            return ev_str
+        return self._fix(ev_str)
+
+    def digest(self) -> str:
+        """Digest of the rules, for keys of anything parsed under them."""
+        data = [self.electives, self.fixups]
+        return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+    def _category(self, ev_str: str) -> str | None:
+        if self._elective_re is None:
+            return None
+        best = None
+        for m in self._elective_re.finditer(ev_str):
+            i = self._elective_ranks[m.group()]
+            if best is None or i < best:
+                best = i
+                if best == 0:
+                    break
+        return None if best is None else self._categories[best]
+
+    def _fix(self, ev_str: str) -> str | None:
+        for find, replacement, whole in self._steps:
+            if whole is None:
+                ev_str = find.sub(replacement, ev_str)
+            elif find in ev_str:
+                if replacement is None:
+                    return None
+                ev_str = replacement if whole else ev_str.replace(find, replacement)
+        return ev_str
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    An alternation matching each of `words`, a word before its own
+    prefixes, with common prefixes factored out: ["CL13", "CL304"] ->
+    "CL(?:13|304)".
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        ends = "" in node
+        branches = [re.escape(ch) + build(sub) for ch, sub in node.items() if ch]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not ends:
+            return branches[0]
+        # the word ending here is tried after every longer one
+        return "(?:" + "|".join(branches) + (")?" if ends else ")")
+
+    return build(trie)
+
+
+_event_rules: EventRules | None = None
+
+
+def get_event_rules() -> EventRules:
+    """
+    The rules `Event.from_string` applies. Loaded on first use from
+    $JIIT_TT_EVENT_RULES if set, else from the shipped `event_rules.json`.
+    """
+    global _event_rules
+    if _event_rules is None:
+        _event_rules = EventRules.load(
+            os.environ.get("JIIT_TT_EVENT_RULES") or DEFAULT_RULES_PATH
+        )
+    return _event_rules
+
+
+def set_event_rules(rules: EventRules | str | None):
+    """
+    Replace the rules for this process with an `EventRules` or the path of
+    a rules file. None goes back to the default on the next lookup. Worker
+    processes that don't fork from this one only see $JIIT_TT_EVENT_RULES.
+    """
+    global _event_rules
+    if isinstance(rules, str):
+        rules = EventRules.load(rules)
+    _event_rules = rules
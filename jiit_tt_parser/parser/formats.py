@@ -0,0 +1,170 @@
+from typing import Callable, Dict, Iterable, List, NamedTuple
+
+from jiit_tt_parser.utils.grid import SheetGrid
+
+# extract(sheet, first row, header column, last row) -> {key: value}
+Extractor = Callable[[SheetGrid, int, int, int], dict]
+# check(tokens, j) -> whether the header at column j really is this format
+Check = Callable[[list, int], bool]
+
+
+class LegendFormat(NamedTuple):
+    """
+    One layout of a legend table, i.e. a header cell with rows below it.
+
+    `kind` is what the table lists, "courses" or "faculty". The header is
+    recognised by its `signatures`, (previous, current, next) cell strings
+    where None matches any cell, or by the stripped cell starting with one
+    of `prefixes`. `check` can look further along the row. `extract` reads
+    the rows below the header.
+    """
+
+    name: str
+    kind: str
+    extract: Extractor
+    signatures: tuple[tuple[str | None, str, str | None], ...] = ()
+    prefixes: tuple[str, ...] = ()
+    check: Check | None = None
+
+
+class LegendTable(NamedTuple):
+    format: str  # key of FORMATS
+    row: int
+    col: int
+
+
+# name -> format, in registration order which breaks ties between formats
+FORMATS: Dict[str, LegendFormat] = {}
+
+# lookup tables over FORMATS, rebuilt by register_format
+_signatures: Dict[tuple, List[LegendFormat]] = {}
+_header_cells: frozenset = frozenset()
+_prefixes: List[tuple[str, LegendFormat]] = []
+_prefix_initials: frozenset = frozenset()
+
+
+def register_format(fmt: LegendFormat) -> LegendFormat:
+    """Add or replace a legend format, later scans will look for it."""
+    global _header_cells, _prefix_initials
+    FORMATS[fmt.name] = fmt
+
+    _signatures.clear()
+    _prefixes.clear()
+    for f in FORMATS.values():
+        for signature in f.signatures:
+            _signatures.setdefault(signature, []).append(f)
+        _prefixes.extend((prefix, f) for prefix in f.prefixes)
+    _header_cells = frozenset(cur for _, cur, _ in _signatures)
+    _prefix_initials = frozenset(prefix[:1] for prefix, _ in _prefixes)
+
+    return fmt
+
+
+def formats_of_kind(kind: str) -> List[str]:
+    return [name for name, fmt in FORMATS.items() if fmt.kind == kind]
+
+
+def scan_legends(
+    sheet: SheetGrid,
+    row: int | None = None,
+    col: int | None = None,
+    formats: Iterable[str] | None = None,
+) -> List[LegendTable]:
+    """
+    Every legend table in the first `row` rows and `col` columns, in
+    reading order, in one pass over the sheet.
+
+    Each row is turned into strings once and a cell is only looked up when
+    it can start a header. Signatures are tried exact first, then with any
+    previous cell, any next cell, any of both, then the prefixes. A cell
+    heads at most one table of each kind, the first format to match among
+    `formats` (every registered one if None).
+    """
+    row = sheet.rows if row is None else row
+    col = sheet.cols if col is None else col
+    allowed = set(FORMATS if formats is None else formats)
+
+    tables = []
+    # room for the neighbours read past the last column
+    padding = ["None"] * (max(col - sheet.cols, 0) + 8)
+    for i in range(1, row + 1):
+        values = sheet.row(i)
+        if not any(v is not None for v in values[:col]):
+            continue
+        # tokens[j] is column j, tokens[0] stands in for "no previous cell"
+        tokens = [None, *map(str, values), *padding]
+        for j in range(1, col + 1):
+            cur = tokens[j]
+            candidates = []
+            if cur in _header_cells:
+                prev, nxt = tokens[j - 1], tokens[j + 1]
+                for key in (
+                    (prev, cur, nxt),
+                    (None, cur, nxt),
+                    (prev, cur, None),
+                    (None, cur, None),
+                ):
+                    candidates.extend(_signatures.get(key, ()))
+            stripped = cur.strip() if cur is not None else ""
+            if stripped[:1] in _prefix_initials:
+                candidates.extend(
+                    f for prefix, f in _prefixes if stripped.startswith(prefix)
+                )
+            if not candidates:
+                continue
+
+            kinds = set()
+            for fmt in candidates:
+                if fmt.kind in kinds or fmt.name not in allowed:
+                    continue
+                if fmt.check is not None and not fmt.check(tokens, j):
+                    continue
+                kinds.add(fmt.kind)
+                tables.append(LegendTable(fmt.name, i, j))
+
+    return tables
+
+
+def extract_legends(
+    sheet: SheetGrid,
+    row: int | None = None,
+    col: int | None = None,
+    formats: Iterable[str] | None = None,
+) -> Dict[str, dict]:
+    """
+    The maps read from every legend table found by `scan_legends`, one per
+    kind, e.g. {"courses": {...}, "faculty": {...}}. Tables are read in
+    sheet order, a later entry for a key wins.
+    """
+    row = sheet.rows if row is None else row
+    return read_legends(sheet, scan_legends(sheet, row, col, formats), row)
+
+
+def read_legends(
+    sheet: SheetGrid, tables: Iterable[LegendTable], row: int | None = None
+) -> Dict[str, dict]:
+    """`extract_legends` over tables already found, reading down to `row`."""
+    row = sheet.rows if row is None else row
+    maps: Dict[str, dict] = {}
+    for name, i, j in tables:
+        fmt = FORMATS[name]
+        maps.setdefault(fmt.kind, {}).update(fmt.extract(sheet, i + 1, j, row))
+    return maps
+
+
+def read_pairs(key: int, value: int) -> Extractor:
+    """
+    Extractor for tables of (key, value) columns at these offsets from the
+    header, read down until the header's own column is empty.
+    """
+
+    def extract(sheet: SheetGrid, r: int, c: int, _: int) -> dict:
+        pairs = {}
+        while sheet.value(r, c) is not None:
+            k = sheet.value(r, c + key)
+            v = sheet.value(r, c + value)
+            pairs.update({str(k).strip(): str(v).strip()})
+            r += 1
+        return pairs
+
+    return extract
@@ -0,0 +1,21 @@
+from typing import TYPE_CHECKING
+
+# both register their legend formats on import
+import jiit_tt_parser.parser.parse_courses  # noqa: F401
+import jiit_tt_parser.parser.parse_faculty  # noqa: F401
+from jiit_tt_parser.parser.formats import extract_legends
+from jiit_tt_parser.utils.grid import SheetGrid, as_grid
+
+if TYPE_CHECKING:
+    from openpyxl.worksheet.worksheet import Worksheet
+
+
+def parse_legends(
+    sheet: "SheetGrid | Worksheet | str", row: int | None = None, col: int | None = None
+) -> tuple[dict, dict]:
+    """
+    The course and faculty maps of every legend table in the sheet, found
+    in a single scan over one load of the workbook.
+    """
+    legends = extract_legends(as_grid(sheet), row, col)
+    return legends.get("courses", {}), legends.get("faculty", {})
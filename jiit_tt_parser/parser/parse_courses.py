@@ -1,145 +1,208 @@
-from typing import Dict
+from typing import TYPE_CHECKING, Dict, List
 
-from openpyxl.worksheet.worksheet import Worksheet
+from jiit_tt_parser.parser.formats import (FORMATS, LegendFormat, LegendTable,
+                                           extract_legends, formats_of_kind,
+                                           register_format, scan_legends)
+from jiit_tt_parser.utils.grid import SheetGrid, as_grid
 
+if TYPE_CHECKING:
+    from openpyxl.worksheet.worksheet import Worksheet
 
-def parse_down(sheet: Worksheet, i, j, r, _, ftype):
+
+def extract_short_code(sheet: SheetGrid, i: int, j: int, r: int) -> dict:
+    """Short code, subject code, then name columns."""
+    course_map = {}
+    while i <= r:
+        v = sheet.value(i, j)
+        v2 = sheet.value(i, j + 1)
+        s = sheet.value(i, j + 2)
+        i += 1
+
+        if v2 == "(19M21HS111)":
+            course_map.update({str(v2).strip("() "): str(s)})
+
+        if v is None or v2 is None or s is None:
+            continue
+
+        v = str(v).strip("() ")
+        v2 = str(v2).strip("() ")
+        s = str(s).strip()
+        update(course_map, v, s, v2, s)
+        # course_map.update({v: s, v2: s})
+    return course_map
+
+
+def extract_short_form(sheet: SheetGrid, i: int, j: int, r: int) -> dict:
+    """"SHORT/CODE" pairs next to names, up to the faculty legend."""
+    course_map = {}
+    while i <= r:
+        v = str(sheet.value(i, j))
+        s = str(sheet.value(i, j + 1)).strip(" -")
+        if v == "Faculty Abbreviation with Names" or v == "Faculty Abbreviation":
+            break
+
+        i += 1
+        if v is None or s is None:
+            continue
+
+        v = v.replace(" ", "")
+        v = v.replace("\n", "")
+        if "/" in v:
+            v1, v2 = v.split("/")
+        else:
+            v1 = v2 = v
+
+        update(course_map, v1.strip(), s, v2.strip(), s, v.strip(), s)
+        # course_map.update({v1.strip(): s, v2.strip(): s, v.strip(): s})
+    return course_map
+
+
+def extract_subject_code(sheet: SheetGrid, i: int, j: int, r: int) -> dict:
+    """Full subject codes next to names, while the codes look like codes."""
+    course_map = {}
+    while i <= r:
+        v = str(sheet.value(i, j)).strip().replace(" ", "").replace("\n", "")
+        s = str(sheet.value(i, j + 1)).strip()
+        if not (len(v) > 3 and v[:2].isnumeric() and v[2:3].isalpha()):
+            break
+        i += 1
+
+        v1 = v
+        v2 = v[2:]
+        v3 = v[5:]
+
+        update(course_map, v, s, v2, s, v3, s)
+        course_map.update({v: s, v2: s, v3: s})
+    return course_map
+
+
+def extract_course_code(sheet: SheetGrid, i: int, j: int, r: int) -> dict:
+    """Course codes with the name in the column before."""
     course_map = {}
-    if ftype == 1:
-        while i <= r:
-            v = sheet.cell(i, j).value
-            v2 = sheet.cell(i, j + 1).value
-            s = sheet.cell(i, j + 2).value
-            i += 1
-
-            if v2 == "(19M21HS111)":
-                course_map.update({str(v2).strip("() "): str(s)})
-
-            if v is None or v2 is None or s is None:
-                continue
-
-            v = str(v).strip("() ")
-            v2 = str(v2).strip("() ")
-            s = str(s).strip()
-            update(course_map, v, s, v2, s)
-            # course_map.update({v: s, v2: s})
-    elif ftype == 2:
-        while i <= r:
-            v = str(sheet.cell(i, j).value)
-            s = str(sheet.cell(i, j + 1).value).strip(" -")
-            if v == "Faculty Abbreviation with Names" or v == "Faculty Abbreviation":
-                break
-
-            i += 1
-            if v is None or s is None:
-                continue
-
-            v = v.replace(" ", "")
-            v = v.replace("\n", "")
-            if "/" in v:
-                v1, v2 = v.split("/")
-            else:
-                v1 = v2 = v
-
-            update(course_map, v1.strip(), s, v2.strip(), s, v.strip(), s)
-            # course_map.update({v1.strip(): s, v2.strip(): s, v.strip(): s})
-    elif ftype == 3:
-        while i <= r:
-            v = str(sheet.cell(i, j).value).strip().replace(" ", "").replace("\n", "")
-            s = str(sheet.cell(i, j + 1).value).strip()
-            if not (len(v) > 3 and v[:2].isnumeric() and v[2:3].isalpha()):
-                break
-            i += 1
-
-            v1 = v
-            v2 = v[2:]
-            v3 = v[5:]
-
-            update(course_map, v, s, v2, s, v3, s)
-            course_map.update({v: s, v2: s, v3: s})
-
-    elif ftype == 4:
-        while i <= r:
-            code = sheet.cell(i, j).value
-            name = sheet.cell(i, j - 1).value
-            i += 1
-            if code is None or name is None:
-                continue
-            update(course_map, str(code).strip(), str(name).strip())
-            # course_map.update({str(code).strip(): str(name).strip()})
-
-    elif ftype == 5:
-        while i <= r:
-            short = sheet.cell(i, j).value
-            name = sheet.cell(i, j + 2).value
-            i += 1
-            if not short or not name:
-                continue
-
-            short = str(short).strip()
-            name = str(name).strip()
-            update(course_map, short, name)
-            # course_map[short] = name
-
-    elif ftype == 6:
-        while i <= r:
-            faculty_name = sheet.cell(i, j).value  # col: Faculty Names
-            faculty_abbr = sheet.cell(i, j + 1).value  # col: Faculty Abbreviation
-            code = sheet.cell(i, j + 4).value  # col: COURSE CODE
-            title = sheet.cell(i, j + 5).value  # col: COURSE TITLE
-            i += 1
-            if not code or not title:
-                continue
-            update(course_map, str(code).strip(), str(title).strip())
-
-    # print(course_map)
+    while i <= r:
+        code = sheet.value(i, j)
+        name = sheet.value(i, j - 1)
+        i += 1
+        if code is None or name is None:
+            continue
+        update(course_map, str(code).strip(), str(name).strip())
+        # course_map.update({str(code).strip(): str(name).strip()})
     return course_map
 
 
-def parse_courses(sheet: Worksheet, row: int, col: int):
+def extract_short_name(sheet: SheetGrid, i: int, j: int, r: int) -> dict:
+    """Short names with the name two columns over."""
     course_map = {}
-    for i in range(1, row + 1):
-        for j in range(1, col + 1):
-            pvalue = None
-            if j - 1 > 0:
-                pvalue = str(sheet.cell(i, j - 1).value)
-            value = str(sheet.cell(i, j).value)
-            nvalue = str(sheet.cell(i, j + 1).value)
-            if value in ["Short Subject Code", "CODE", "SHORT FORM"] and (
-                nvalue in ["Subject Code", "SUBJECT CODE"]
-            ):
-                course_map.update(parse_down(sheet, i + 1, j, row, col, ftype=1))
-            elif value in ["SHORT FORM / SUBJECT CODE", "SHORT FORM /"] and nvalue in [
-                "SUBJECT NAME"
-            ]:
-                course_map.update(parse_down(sheet, i + 1, j, row, col, ftype=2))
-            elif (
-                pvalue in ["Name"]
-                and value in ["SUBJECT CODE"]
-                and nvalue in ["SUBJECT NAME"]
-            ):
-                course_map.update(parse_down(sheet, i + 1, j, row, col, ftype=2))
-            elif (
-                pvalue not in ["Name"]
-                and value in ["SUBJECT CODE"]
-                and nvalue in ["SUBJECT NAME"]
-            ):
-                course_map.update(parse_down(sheet, i + 1, j, row, col, ftype=3))
-
-            elif pvalue in ["COURSE"] and value in ["COURSE CODE"]:
-                course_map.update(parse_down(sheet, i + 1, j, row, col, ftype=4))
-
-            elif value == "Short Name" and nvalue == "Course Code":
-                course_map.update(parse_down(sheet, i + 1, j, row, col, ftype=1))
-            elif value == "Faculty Names" and nvalue == "Faculty Abbreviation":
-                v2 = str(sheet.cell(i, j + 4).value)
-                v3 = str(sheet.cell(i, j + 5).value)
-                if v2 == "COURSE CODE" and v3 == "COURSE TITLE":
-                    course_map.update(parse_down(sheet, i + 1, j, row, col, ftype=6))
+    while i <= r:
+        short = sheet.value(i, j)
+        name = sheet.value(i, j + 2)
+        i += 1
+        if not short or not name:
+            continue
+
+        short = str(short).strip()
+        name = str(name).strip()
+        update(course_map, short, name)
+        # course_map[short] = name
+    return course_map
+
 
+def extract_faculty_courses(sheet: SheetGrid, i: int, j: int, r: int) -> dict:
+    """Faculty legend rows that also carry course code and title columns."""
+    course_map = {}
+    while i <= r:
+        faculty_name = sheet.value(i, j)  # col: Faculty Names
+        faculty_abbr = sheet.value(i, j + 1)  # col: Faculty Abbreviation
+        code = sheet.value(i, j + 4)  # col: COURSE CODE
+        title = sheet.value(i, j + 5)  # col: COURSE TITLE
+        i += 1
+        if not code or not title:
+            continue
+        update(course_map, str(code).strip(), str(title).strip())
     return course_map
 
 
+COURSE_FORMATS = [
+    LegendFormat(
+        "short_code",
+        "courses",
+        extract_short_code,
+        signatures=(
+            *(
+                (None, cur, nxt)
+                for cur in ("Short Subject Code", "CODE", "SHORT FORM")
+                for nxt in ("Subject Code", "SUBJECT CODE")
+            ),
+            (None, "Short Name", "Course Code"),
+        ),
+    ),
+    LegendFormat(
+        "short_form",
+        "courses",
+        extract_short_form,
+        signatures=(
+            ("Name", "SUBJECT CODE", "SUBJECT NAME"),
+            (None, "SHORT FORM / SUBJECT CODE", "SUBJECT NAME"),
+            (None, "SHORT FORM /", "SUBJECT NAME"),
+        ),
+    ),
+    LegendFormat(
+        "subject_code",
+        "courses",
+        extract_subject_code,
+        signatures=((None, "SUBJECT CODE", "SUBJECT NAME"),),
+    ),
+    LegendFormat(
+        "course_code",
+        "courses",
+        extract_course_code,
+        signatures=(("COURSE", "COURSE CODE", None),),
+    ),
+    # not seen in a sheet yet, only reachable through parse_down
+    LegendFormat("short_name", "courses", extract_short_name),
+    LegendFormat(
+        "faculty_courses",
+        "courses",
+        extract_faculty_courses,
+        signatures=((None, "Faculty Names", "Faculty Abbreviation"),),
+        check=lambda tokens, j: tokens[j + 4] == "COURSE CODE"
+        and tokens[j + 5] == "COURSE TITLE",
+    ),
+]
+for fmt in COURSE_FORMATS:
+    register_format(fmt)
+
+# the old numeric ftypes of parse_down
+FTYPES = {
+    1: "short_code",
+    2: "short_form",
+    3: "subject_code",
+    4: "course_code",
+    5: "short_name",
+    6: "faculty_courses",
+}
+
+
+def parse_down(sheet: SheetGrid, i, j, r, _, ftype):
+    return FORMATS[FTYPES[ftype]].extract(sheet, i, j, r)
+
+
+def find_course_headers(
+    sheet: "SheetGrid | Worksheet | str", row: int, col: int
+) -> List[LegendTable]:
+    """
+    Every course legend header in the first `row` rows and `col` columns,
+    in reading order, with the format it was recognised as.
+    """
+    return scan_legends(as_grid(sheet), row, col, formats_of_kind("courses"))
+
+
+def parse_courses(sheet: "SheetGrid | Worksheet | str", row: int, col: int):
+    sheet = as_grid(sheet)
+    legends = extract_legends(sheet, row, col, formats_of_kind("courses"))
+    return legends.get("courses", {})
+
+
 def update(map: Dict[str, str], *keyvalues: str):
     if len(keyvalues) % 2 != 0:
         return
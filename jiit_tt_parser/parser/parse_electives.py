@@ -1,45 +1,113 @@
-import pandas as pd
 import re
-from typing import Dict
+from typing import Dict, Iterable, Iterator
+
+import openpyxl
+
+from jiit_tt_parser.utils.grid import SheetGrid
+
+# 15B1NHS431 -> ("15B1NHS", "431"), for the second code of a "431/432" pair
+PAIRED_CODE_RE = re.compile(r"(.+?)(\d+)$")
+
+
+def iter_elective_rows(
+    source: str | SheetGrid, sheet_name=0, header_row: int = 3
+) -> Iterator[tuple]:
+    """
+    The rows below the header, `header_row` counting sheet rows from 0 like
+    pandas does. A path is streamed from a read-only workbook, a SheetGrid
+    is read in place.
+    """
+    if isinstance(source, SheetGrid):
+        yield from source.values[header_row + 1 :]
+        return
+
+    wb = openpyxl.load_workbook(source, read_only=True, data_only=True)
+    try:
+        if isinstance(sheet_name, int):
+            sheet = wb.worksheets[sheet_name]
+        else:
+            sheet = wb[sheet_name]
+        yield from sheet.iter_rows(min_row=header_row + 2, values_only=True)
+    finally:
+        wb.close()
+
+
+def iter_electives(
+    rows: Iterable[tuple], code_col_idx: int = 0, subj_col_idx: int = 3
+) -> Iterator[tuple[str, str]]:
+    """
+    (code, subject) pairs of the elective rows. A "CODE1/2" pair yields both
+    CODE1 and CODE2, rows without a code or subject are skipped.
+    """
+    for row in rows:
+        if len(row) <= max(code_col_idx, subj_col_idx):
+            continue
+        raw_code, subject = row[code_col_idx], row[subj_col_idx]
+        if raw_code is None or subject is None:
+            continue
+
+        raw_code = str(raw_code).strip()
+        subject = str(subject).strip()
+
+        if "/" in raw_code:
+            base, _ = raw_code.split("/", 1)
+            yield base, subject
+
+            m = PAIRED_CODE_RE.match(base)
+            if m:
+                prefix, num = m.groups()
+                yield f"{prefix}{int(num)+1}", subject
+        else:
+            yield raw_code, subject
+
 
 def parse_electives(
-    file_path: str,
+    file_path: str | SheetGrid,
     sheet_name=0,
     header_row: int = 3,
     code_col_idx: int = 0,
-    subj_col_idx: int = 3
+    subj_col_idx: int = 3,
+    engine: str = "openpyxl",
 ) -> Dict[str, str]:
+    """
+    Map of elective code to subject name from an electives workbook, or an
+    already loaded SheetGrid of one.
+
+    Rows are streamed from a read-only workbook. `engine="pandas"` reads
+    through `pandas.read_excel` as before, for which pandas has to be
+    installed (the `pandas` extra).
+    """
+    if engine == "pandas":
+        return parse_electives_pandas(
+            file_path, sheet_name, header_row, code_col_idx, subj_col_idx
+        )
+    if engine != "openpyxl":
+        raise ValueError(f"Unknown engine: '{engine}'")
 
+    rows = iter_elective_rows(file_path, sheet_name, header_row)
+    return dict(iter_electives(rows, code_col_idx, subj_col_idx))
+
+
+def parse_electives_pandas(
+    file_path: str,
+    sheet_name=0,
+    header_row: int = 3,
+    code_col_idx: int = 0,
+    subj_col_idx: int = 3,
+) -> Dict[str, str]:
+    import pandas as pd
 
     df = pd.read_excel(
-        file_path,
-        sheet_name=sheet_name,
-        header=header_row,
-        engine="openpyxl"
+        file_path, sheet_name=sheet_name, header=header_row, engine="openpyxl"
     )
-    
+
     code_col = df.columns[code_col_idx]
     subj_col = df.columns[subj_col_idx]
-    
-    pattern = re.compile(r"(.+?)(\d+)$")
-    mapping= {}
-    
-    for raw_code, subject in zip(df[code_col].astype(str), df[subj_col].astype(str)):
-        raw_code = raw_code.strip()
-        subject = subject.strip()
-        
-        if '/' in raw_code:
-            base, _ = raw_code.split('/', 1)
-            mapping[base] = subject
-            
-            m = pattern.match(base)
-            if m:
-                prefix, num = m.groups()
-                next_code = f"{prefix}{int(num)+1}"
-                mapping[next_code] = subject
-        else:
-            mapping[raw_code] = subject
-    
-    return mapping
-
 
+    return dict(
+        iter_electives(
+            zip(df[code_col].astype(str), df[subj_col].astype(str)),
+            code_col_idx=0,
+            subj_col_idx=1,
+        )
+    )
@@ -1,16 +1,49 @@
 import datetime
+import functools
+import logging
 import re
 import string
-from typing import Dict, List, Literal
-
-from openpyxl.cell import Cell, MergedCell
-from openpyxl.worksheet.cell_range import CellRange
-from openpyxl.worksheet.worksheet import Worksheet
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Literal
 
 from jiit_tt_parser.parser.parse_courses import parse_courses
-from jiit_tt_parser.parser.parse_electives import parse_electives
-from jiit_tt_parser.utils.utils import (are_cells_in_same_merged_group,
-                                        is_empty_row, load_map)
+from jiit_tt_parser.parser.event_rules import get_event_rules
+from jiit_tt_parser.utils.diagnostics import record_event
+from jiit_tt_parser.utils.grid import MergedIndex, SheetGrid, as_grid
+from jiit_tt_parser.utils.utils import load_map
+
+if TYPE_CHECKING:
+    from openpyxl.worksheet.worksheet import Worksheet
+
+logger = logging.getLogger(__name__)
+
+# Compiled once here, event strings go through these tens of thousands of
+# times per run which is more patterns than `re`'s own cache comfortably holds
+RANGE_RE = re.compile(r"^([A-Z])(\d+)-([A-Z]?)(\d+)$")  # C1-C3, C1-3
+CONCATENATED_BATCHES_RE = re.compile(r"^[A-Z]\d+([A-Z]\d+)+$")  # F2F3F6F7
+BATCH_CODE_RE = re.compile(r"([A-Z])(\d+)")
+SINGLE_BATCH_RE = re.compile(r"^[A-Z]\d+$")
+TIME_SEPARATOR_RE = re.compile(r"[:.]")
+TEACHING_ASSISTANT_RE = re.compile(r"^TA-?(\d+)$")
+NEW_FACULTY_RE = re.compile(r"^NF(.*?)(\d+)$")
+CLASSROOM_CODE_RE = re.compile(r"^[A-Z]{2,}\d+$")
+SHORT_CLASSROOM_CODE_RE = re.compile(r"^([A-Z]{2})(\d+)$")
+CLASSROOM_LIST_RE = re.compile(r"^([A-Z]+)(\d+(?:,\d+)+)$")  # CL09,10
+CLASSROOM_PARTS_RE = re.compile(r"^([A-Z]+)(\d+)$")
+# any letters followed by any digits followed by anything starting with a letter
+CLASSROOM_TEACHER_RE = re.compile(r"^([A-Za-z]+)(\d+)([A-Za-z].*)$")
+FULL_CODE_RE = re.compile(r"^\d{2}[A-Z]\d{1,2}[A-Z]{2}\d{3,4}$")  # 15B11CI111
+MEDIUM_CODE_RE = re.compile(r"^[A-Z]\d{1,2}[A-Z]{2}\d{3,4}$")  # B11CI111
+SHORT_CODE_RE = re.compile(r"^[A-Z]{2}\d{3,4}$")  # CI111
+FULL_CODE_PARTS_RE = re.compile(r"^(\d{2})([A-Z])(\d{1,2})([A-Z]{2})(\d{3,4})$")
+SHORT_CODE_PARTS_RE = re.compile(r"^([A-Z]{2})(\d{3,4})$")
+
+
+@functools.lru_cache(maxsize=None)
+def delimiters_re(delimiters: str) -> re.Pattern:
+    return re.compile(f"[{re.escape(delimiters)}]+")
+
 
 days_of_the_week_names = [
     "monday",
@@ -24,11 +57,36 @@ days_of_the_week_names = [
 
 
 class Period:
+    # minutes since midnight, start_time/end_time are views over these
+    __slots__ = ("start", "end")
+
     def __init__(
         self, start: datetime.time | None = None, end: datetime.time | None = None
     ) -> None:
-        self.start_time = start or datetime.time(0, 0)
-        self.end_time = end or datetime.time(23, 59)
+        self.start = 0 if start is None else start.hour * 60 + start.minute
+        self.end = 23 * 60 + 59 if end is None else end.hour * 60 + end.minute
+
+    @classmethod
+    def from_minutes(cls, start: int, end: int):
+        p = cls.__new__(cls)
+        p.start, p.end = start, end
+        return p
+
+    @property
+    def start_time(self) -> datetime.time:
+        return datetime.time(*divmod(self.start, 60))
+
+    @start_time.setter
+    def start_time(self, t: datetime.time):
+        self.start = t.hour * 60 + t.minute
+
+    @property
+    def end_time(self) -> datetime.time:
+        return datetime.time(*divmod(self.end, 60))
+
+    @end_time.setter
+    def end_time(self, t: datetime.time):
+        self.end = t.hour * 60 + t.minute
 
     @classmethod
     def from_string(cls, fmt: str):
@@ -69,21 +127,41 @@ class Period:
         return cls(start_time, end_time)
 
     def __add__(self, other):
-        start_time = other.start_time
-        end_time = other.end_time
-        if self.start_time < other.start_time:
-            start_time = self.start_time
+        return Period.from_minutes(
+            min(self.start, other.start), max(self.end, other.end)
+        )
 
-        if self.end_time > other.end_time:
-            end_time = self.end_time
+    def __str__(self):
+        return f"{self.start // 60}:{str(self.start % 60).zfill(2)} - {self.end // 60}:{str(self.end % 60).zfill(2)}"
 
-        return Period(start_time, end_time)
 
-    def __str__(self):
-        return f"{self.start_time.hour}:{str(self.start_time.minute).zfill(2)} - {self.end_time.hour}:{str(self.end_time.minute).zfill(2)}"
+def intern_event(ev):
+    """
+    Intern the strings that repeat across a whole timetable, so a parsed
+    institute shares one copy of every day, room, batch and lecturer.
+    """
+    ev.day = sys.intern(ev.day)
+    ev.classroom = sys.intern(ev.classroom)
+    ev.batches = [sys.intern(b) for b in ev.batches]
+    ev.lecturer = [sys.intern(lecturer) for lecturer in ev.lecturer]
+    return ev
 
 
 class Elective:
+    __slots__ = (
+        "event_string",
+        "event_type",
+        "classroom",
+        "event",
+        "eventcode",
+        "period",
+        "day",
+        "lecturer",
+        "category",
+        "batch_cats",
+        "batches",
+    )
+
     def __init__(self, event_string: str):
         self.event_string = event_string
         self.event_type: Literal["L", "T", "P"]
@@ -111,7 +189,7 @@ class Elective:
             return Event.from_string(ev_str, period, day, courses, faculties)
 
         ev_str = ev_str.strip().replace("\n", " ").replace("\xa0", " ")
-        print(repr(ev_str))
+        logger.debug("elective string %r", ev_str)
         og = ev_str
 
         if ev_str == "":
@@ -134,7 +212,7 @@ class Elective:
             raw_batches_128 = raw_batches[0]
         except:
             pass
-        print(raw_batches)
+        logger.debug("raw batches %r", raw_batches)
 
         if (
             "F1" in raw_batches_128
@@ -142,15 +220,15 @@ class Elective:
             or "F8" in raw_batches_128
         ):
             ev.batches = parse_batches(raw_batches_128)
-            print("f found")
+            logger.debug("128 campus batches")
 
         elif "ALL" in raw_batches_128:
             ev.batches = []
             ev.batch_cats = ["E", "F", "H"]
-            print("all found")
+            logger.debug("all batches")
 
         else:
-            print("else condn")
+            logger.debug("batch list")
             for batch_str in raw_batches:
                 batch_str = batch_str.strip()
                 if "-" in batch_str:
@@ -168,11 +246,7 @@ class Elective:
 
         ev.eventcode, ev_str = ev_str[1 : ev_str.find(")")], ev_str[ev_str.find(")") :]
         ev.eventcode = ev.eventcode.strip()
-        ev.event = (
-            lookup_sub(ev.eventcode.strip(), courses)
-            or lookup_sub(ev.eventcode.strip(), courses["super_secret_key"])
-            or ""
-        )
+        ev.event = lookup_subject(ev.eventcode, courses)
         ev.event = " ".join(ev.event.strip().split())
 
         while (ev_str) and ev_str[
@@ -236,10 +310,10 @@ class Elective:
         ev.period = period
         ev.day = day.capitalize()
         if ev.event == "":
-            print(repr(og))
-        print(ev)
+            logger.debug("no subject for %r", og)
+        logger.debug("parsed %s", ev)
 
-        return ev
+        return intern_event(ev)
 
     def __str__(self) -> str:
         lecture_types = {
@@ -262,6 +336,18 @@ Lecturer: {self.lecturer}
 
 
 class Event:
+    __slots__ = (
+        "event_string",
+        "batches",
+        "event_type",
+        "classroom",
+        "event",
+        "eventcode",
+        "period",
+        "day",
+        "lecturer",
+    )
+
     def __init__(self, event_string: str):
         self.event_string = event_string
         self.batches: List[str]
@@ -282,99 +368,20 @@ class Event:
         courses: dict,
         faculties: dict,
     ):
-        if any(e in ev_str for e in ["(25B16CS213)", "(25B16CS212)"]):
-            return Elective.from_string(
-                ev_str, period, day, courses, faculties, "DE-1 LAB"
-            )
-        if any(
-            e in ev_str
-            for e in [
-                "(17B1NEC735)",
-                "(25B12EC211)",
-                "(15B11EC313)",
-                "(25B32EC211)",
-                "(20B12EC211)",
-                "25B42EC211",
-                "21B12CS319",
-                "25B42EC212",
-            ]
-        ):
-            return Elective.from_string(ev_str, period, day, courses, faculties, "DE-1")
-        if any(
-            e in ev_str
-            for e in [
-                "15B1NHS431",
-                "16B1NHS431",
-                "15B1NHS433",
-                "16B1NHS332",
-                "23B12HS211",
-                "15B1NHS433",
-                "16B1NHS332",
-                "23B12HS211",
-                "19B12HS412",
-            ]
-        ):
+        cleaned = ev_str.strip().replace("\n", " ").replace("\xa0", " ")
+        category, fixed = get_event_rules().classify(cleaned)
+        if category:
             return Elective.from_string(
-                ev_str, period, day, courses, faculties, "HSS-1"
+                ev_str, period, day, courses, faculties, category
             )
 
-        ev_str = ev_str.strip().replace("\n", " ").replace("\xa0", " ")
-        print(repr(ev_str))
-        og = ev_str
-
-        if "C1-C3HS" in ev_str:
-            ev_str = ev_str.replace("C1-C3HS", "C1-C3(HS")
-
-        if "LC1-C3(HS211)-/FF1KMB" in ev_str:
-            ev_str = "LC1-C3(HS211)-/FF1/KMB"
-
-        if " - /3084ARJ" in ev_str:
-            ev_str = ev_str.replace("3084ARJ", "3084/ARJ")
+        logger.debug("event string %r", cleaned)
+        og = cleaned
 
-        if ev_str.startswith("PBG") and ev_str[3].isdigit():
-            ev_str = "PG" + ev_str[3:]
-
-        if "A5-A6-A10" in ev_str:
-            ev_str = ev_str.replace("A5-A6-A10", "A5,A6,A10")
-
-        if "NF1 (DSH)" in ev_str:
+        ev_str = fixed
+        if ev_str is None:
             return
 
-        if "PB9,PB10" in ev_str:
-            ev_str = ev_str.replace("PB9,PB10", "PB9,10")
-
-        if "PG2,PB16" in ev_str:
-            ev_str = ev_str.replace("PG2,PB16", "PG2,B16")
-
-        if "PBG1,BG2" in ev_str:
-            ev_str = ev_str.replace("PBG1,BG2", "PG1,G2")
-
-        if "BG2" in ev_str:
-            ev_str = ev_str.replace("BG2", "G2")
-
-        if "17A18" in ev_str:
-            ev_str = ev_str.replace("17A18", "A17,A18")
-        if "BCA 3 &BCA 4" in ev_str:
-            ev_str = ev_str.replace("BCA 3 &BCA 4", "BCA3,BCA4")
-        if "(23B65CA224  CL306,)" in ev_str:
-            ev_str = ev_str.replace("(23B65CA224  CL306,)", "(23B65CA224) - CL306/")
-        if "CC417 KM" in ev_str:
-            ev_str = ev_str.replace("CC417 KM", "CC417/KM")
-
-        if "CL304 SHV" in ev_str:
-            ev_str = ev_str.replace("CL304 SHV", "CL304/SHV")
-
-        if "CC 421 SHV" in ev_str:
-            ev_str = ev_str.replace("CC 421 SHV", "CC421/SHV")
-        if "CL13, CL14" in ev_str:
-            ev_str = ev_str.replace("CL13, CL14", "CL13,14")
-
-        if "CL13,CL14" in ev_str:
-            ev_str = ev_str.replace("CL13,CL14", "CL13,14")
-
-        if "(GE1120" in ev_str:
-            ev_str = ev_str.replace("(GE1120", "(GE112)")
-
         if ev_str == "":
             return None
         ev = cls(ev_str)
@@ -392,7 +399,7 @@ class Event:
 
             ev.period = period
             ev.day = day.capitalize()
-            return ev
+            return intern_event(ev)
 
         ev.event_type, ev_str = ev_str[:1], ev_str[1:]
 
@@ -413,11 +420,7 @@ class Event:
         ev.eventcode = ev.eventcode.strip()
         if ev.eventcode == "M302":
             ev.eventcode = "MA302"
-        ev.event = (
-            lookup_sub(ev.eventcode.strip(), courses)
-            or lookup_sub(ev.eventcode.strip(), courses["super_secret_key"])
-            or ""
-        )
+        ev.event = lookup_subject(ev.eventcode, courses)
         ev.event = " ".join(
             ev.event.replace("\xa0", " ").replace("\n", " ").strip().split()
         )
@@ -480,10 +483,10 @@ class Event:
         ev.period = period
         ev.day = day.capitalize()
         if ev.event == "":
-            print(repr(og))
-        print(ev)
+            logger.debug("no subject for %r", og)
+        logger.debug("parsed %s", ev)
 
-        return ev
+        return intern_event(ev)
 
     def __str__(self) -> str:
         lecture_types = {
@@ -520,14 +523,8 @@ def extract_substrings(input_string, delimiters=",/\\"):
     if not delimiters:
         return [input_string.strip()] if input_string.strip() else []
 
-    # Escape special regex characters in delimiters
-    escaped_delimiters = re.escape(delimiters)
-
-    # Create regex pattern: [escaped_delimiters]+
-    pattern = f"[{escaped_delimiters}]+"
-
     # Split by any combination of the specified delimiters
-    substrings = re.split(pattern, input_string)
+    substrings = delimiters_re(delimiters).split(input_string)
 
     # Filter out empty strings that might result from multiple consecutive delimiters
     result = [substring.strip() for substring in substrings if substring.strip()]
@@ -573,15 +570,15 @@ def parse_batches(batch_string):
         if "-" in part:
             result.extend(parse_range(part))
             # Update current letter from the range
-            range_match = re.match(r"^([A-Z])(\d+)-([A-Z]?)(\d+)$", part)
+            range_match = RANGE_RE.match(part)
             if range_match:
                 current_letter = range_match.group(1)
 
         # Check if it's a concatenated format like F2F3F6F7
-        elif re.match(r"^[A-Z]\d+([A-Z]\d+)+$", part):
+        elif CONCATENATED_BATCHES_RE.match(part):
             result.extend(parse_concatenated(part))
             # Update current letter from the last batch in concatenated format
-            matches = re.findall(r"([A-Z])(\d+)", part)
+            matches = BATCH_CODE_RE.findall(part)
             if matches:
                 current_letter = matches[-1][0]
 
@@ -592,7 +589,7 @@ def parse_batches(batch_string):
             result.append(f"{current_letter}{part}")
 
         # Check if it's a single batch code
-        elif re.match(r"^[A-Z]\d+$", part):
+        elif SINGLE_BATCH_RE.match(part):
             result.append(part)
             # Update current letter
             current_letter = part[0]
@@ -614,8 +611,8 @@ def is_string_only_format(part):
     # If it contains only letters, hyphens, and possibly other non-digit characters
     # and doesn't match the standard batch pattern, consider it string-only
     return (
-        not re.match(r"^[A-Z]\d+$", part)
-        and not re.search(r"[A-Z]\d+", part)
+        not SINGLE_BATCH_RE.match(part)
+        and not BATCH_CODE_RE.search(part)
         and not part.isdigit()
     )
 
@@ -623,7 +620,7 @@ def is_string_only_format(part):
 def parse_range(range_str):
     """Parse a range like 'C1-C3' or 'C1-3' into individual batches."""
     # Match patterns like C1-C3 or C1-3
-    match = re.match(r"^([A-Z])(\d+)-([A-Z]?)(\d+)$", range_str)
+    match = RANGE_RE.match(range_str)
 
     if not match:
         raise ValueError(f"Invalid range format: '{range_str}'")
@@ -648,7 +645,7 @@ def parse_range(range_str):
 def parse_concatenated(concat_str):
     """Parse concatenated format like 'F2F3F6F7' into individual batches."""
     # Find all batch codes in the concatenated string
-    matches = re.findall(r"([A-Z])(\d+)", concat_str)
+    matches = BATCH_CODE_RE.findall(concat_str)
 
     if not matches:
         raise ValueError(f"No valid batch codes found in: '{concat_str}'")
@@ -669,21 +666,21 @@ def split_on_regex_starts(s: str, rx: re.Pattern) -> list[str]:
     return parts
 
 
-def get_time_row(sheet: Worksheet, row, col):
+def get_time_row(sheet: SheetGrid, row, col):
     for i in range(1, row + 1):
-        v = sheet.cell(i, 2).value
+        v = sheet.value(i, 2)
         if str(v).startswith("9") or str(v).startswith("8"):
             for j in range(2, col + 1):
-                if sheet.cell(i, j).value is None:
+                if sheet.value(i, j) is None:
                     return i, j - 1
             return i, col
     return 2, col
 
 
-def get_day_row(sheet: Worksheet, row, _, day: str):
+def get_day_row(sheet: SheetGrid, row, _, day: str):
     day = day.lower()
     for i in range(1, row + 1):
-        v = str(sheet.cell(i, 1).value).lower()
+        v = str(sheet.value(i, 1)).lower()
         if day.startswith(v):
             return i
 
@@ -695,10 +692,10 @@ def is_single_ended_time_str(v: str):
     return v[0].isdigit() and v.endswith("-")
 
 
-def get_periods(sheet: Worksheet, _, col, time_row):
+def get_periods(sheet: SheetGrid, _, col, time_row):
     a = []
     for i in range(2, col + 1):
-        v = str(sheet.cell(time_row, i).value)
+        v = str(sheet.value(time_row, i))
         if is_single_ended_time_str(v):
             p = Period.from_string_single_ended(v)
         else:
@@ -708,42 +705,44 @@ def get_periods(sheet: Worksheet, _, col, time_row):
     return a
 
 
-def is_end_of_day(sheet: Worksheet, curr, day, cols):
+def is_end_of_day(
+    sheet: SheetGrid, curr, day, cols, merged_cells: MergedIndex | None = None
+):
     # if curr >= 300:
     #     return True
 
     if day.lower() != "saturday":
-        return sheet.cell(curr + 1, 1).value is not None
+        return sheet.value(curr + 1, 1) is not None
 
-    # v = sheet.cell(curr, 1).value
+    # v = sheet.value(curr, 1)
     # print(v)
-    theme = sheet.cell(curr, 1).fill.start_color.theme
+    theme = sheet.fill_theme(curr, 1)
     if theme is not None and theme == 1:
         return True
 
-    if isinstance(sheet.cell(curr, 1), MergedCell):
-        if not are_cells_in_same_merged_group(
-            sheet, sheet.cell(curr, 1), sheet.cell(curr + 1, 1)
-        ):
+    if merged_cells is None:
+        merged_cells = sheet.merged_index
+
+    if merged_cells.is_merged(curr, 1):
+        if not merged_cells.same_group((curr, 1), (curr + 1, 1)):
             return True
     else:
-        if is_empty_row(sheet, curr, cols):
+        if sheet.is_empty_row(curr, cols):
             return True
 
     return False
 
 
-def search_merged_cells(merged_cells: list[CellRange], cell: Cell) -> int | None:
-    for c in merged_cells:
-        if c.min_row != c.max_row:
-            continue
+def search_merged_cells(merged_cells: MergedIndex, row: int, col: int) -> int | None:
+    c = merged_cells.range_for(row, col)
+    if c is None:
+        return None
 
-        if (c.min_row == cell.row) and (
-            cell.column >= c.min_col and cell.column <= c.max_col
-        ):
-            return c.max_col
+    min_row, _, max_row, max_col = c
+    if min_row != max_row:
+        return None
 
-    return None
+    return max_col
 
 
 EVENT_HEAD_RE = re.compile(r"[A-Z]{1,3}\d+[A-Z0-9]*\(")
@@ -761,6 +760,9 @@ def fix_128tt_bad_merged_cells(
             except:
                 ep = periods[j + i - 3]
             ev = Event.from_string(ev_str, ep, day, courses, faculties)
+            record_event(ev_str, day, ev)
+            if ev is None:
+                continue
             events.append(ev)
 
         return True
@@ -793,13 +795,13 @@ def get_elective_categories_map():
 
 
 def parse_day_with_electives(
-    sheet: Worksheet,
+    sheet: SheetGrid,
     _: int,  # row
     col: int,
     start,
     periods: List[Period],
     day: str,
-    merged_cells: list[CellRange],
+    merged_cells: MergedIndex,
     courses: dict,
     faculties: dict,
 ) -> List[Event | Elective]:
@@ -819,20 +821,19 @@ def parse_day_with_electives(
     elective_cats = get_elective_categories_map()
 
     events = []
-    if str(sheet.cell(start, 2).value).startswith("9"):
-        start += 1
+    start = get_day_first_row(sheet, start)
     elective_set = set()
     for j in range(2, col + 1):
         r = start
         elective_cat = (
-            "MINOR" if periods[j - 2].start_time == datetime.time(13, 0) else ""
+            "MINOR" if periods[j - 2].start == 13 * 60 else ""
         )
         reached_end = False
         while not reached_end:
-            reached_end = is_end_of_day(sheet, r, day, col)
-            c = sheet.cell(r, j)
+            reached_end = is_end_of_day(sheet, r, day, col, merged_cells)
+            v = sheet.value(r, j)
             r += 1
-            if (v := c.value) is None:
+            if v is None:
                 continue
             v = str(v)
 
@@ -856,7 +857,7 @@ def parse_day_with_electives(
                 continue
 
             ep = periods[j - 2]
-            if m := search_merged_cells(merged_cells, c):
+            if m := search_merged_cells(merged_cells, r - 1, j):
                 ep += periods[m - 2]
 
             if (
@@ -871,6 +872,7 @@ def parse_day_with_electives(
                 ev = Elective.from_string(ev_str, ep, day, courses, faculties, cat)
             else:
                 ev = Event.from_string(ev_str, ep, day, courses, faculties)
+            record_event(ev_str, day, ev)
             if ev is None:
                 continue
 
@@ -881,139 +883,233 @@ def parse_day_with_electives(
     return events
 
 
+# cells parse_day skips, and category headers that end a column's events
+DAY_SPAM_ENTRIES = [
+    "LUNCH",
+    "ALL BATCH FREE FOR MEETING",
+    "FREE TS11",
+    "/NFMATH3",
+    "BLOCKED",
+    "LECTURE AND TUTORIAL CLASSES ARE BLOCKED FOR TALKS.",
+    "/UNCHFORA10",
+    "LUNCH FOR A10,B14,C1",
+]
+
+DAY_ELECTIVE_CATEGORIES = [
+    "SE",
+    "HSS 1",
+    "HSS1",
+    "HSS-1",
+    "HSS 2",
+    "HSS2",
+    "HSS-2",
+    "OE 2",
+    "OE2",
+    "OE-2",
+    "DE 1",
+    "DE1",
+    "DE-1",
+    "DE 2",
+    "DE2",
+    "DE-2",
+    "DE 3",
+    "DE3",
+    "DE-3",
+    "DE 4",
+    "DE4",
+    "DE-4",
+    "DE 5",
+    "DE5",
+    "DE-5",
+    "DE 6",
+    "DE6",
+    "DE-6",
+]
+
+
+def get_day_first_row(sheet: SheetGrid, start: int) -> int:
+    """First row of events in the day block whose label is at `start`."""
+    if str(sheet.value(start, 2)).startswith("9"):
+        start += 1
+    return start
+
+
+def get_day_last_row(
+    sheet: SheetGrid, start: int, day: str, col: int, merged_cells: MergedIndex
+) -> int:
+    """Last row the day parsers read for the block starting at `start`."""
+    r = start
+    while not is_end_of_day(sheet, r, day, col, merged_cells):
+        r += 1
+    return r
+
+
 def parse_day(
-    sheet: Worksheet,
+    sheet: SheetGrid,
     _: int,  # row
     col: int,
     start,
     periods: List[Period],
     day: str,
-    merged_cells: list[CellRange],
+    merged_cells: MergedIndex,
     courses: dict,
     faculties: dict,
 ) -> List[Event]:
-    spam_entries = [
-        "LUNCH",
-        "ALL BATCH FREE FOR MEETING",
-        "FREE TS11",
-        "/NFMATH3",
-        "BLOCKED",
-        "LECTURE AND TUTORIAL CLASSES ARE BLOCKED FOR TALKS.",
-        "/UNCHFORA10",
-        "LUNCH FOR A10,B14,C1",
-    ]
-
-    elective_categories = [
-        "SE",
-        "HSS 1",
-        "HSS1",
-        "HSS-1",
-        "HSS 2",
-        "HSS2",
-        "HSS-2",
-        "OE 2",
-        "OE2",
-        "OE-2",
-        "DE 1",
-        "DE1",
-        "DE-1",
-        "DE 2",
-        "DE2",
-        "DE-2",
-        "DE 3",
-        "DE3",
-        "DE-3",
-        "DE 4",
-        "DE4",
-        "DE-4",
-        "DE 5",
-        "DE5",
-        "DE-5",
-        "DE 6",
-        "DE6",
-        "DE-6",
-    ]
     events = []
-    if str(sheet.cell(start, 2).value).startswith("9"):
-        start += 1
+    start = get_day_first_row(sheet, start)
 
     for j in range(2, col + 1):
-        r = start
-        # elective_cat = ""
-        reached_end = False
-        while not reached_end:
-            reached_end = is_end_of_day(sheet, r, day, col)
-            c = sheet.cell(r, j)
-            r += 1
-            if (v := c.value) is None:
-                continue
-            v = str(v)
+        events.extend(
+            parse_day_column(
+                sheet, col, start, j, periods, day, merged_cells, courses, faculties
+            )
+        )
 
-            if fix_128tt_bad_merged_cells(
-                j, v, day, courses, faculties, periods, events
-            ):
-                continue
+    return events
 
-            ev_str = str(v).replace("\xa0", " ").replace("\n", " ").strip().upper()
 
-            if ev_str in elective_categories:
-                break
+def parse_day_column(
+    sheet: SheetGrid,
+    col: int,
+    start: int,
+    j: int,
+    periods: List[Period],
+    day: str,
+    merged_cells: MergedIndex,
+    courses: dict,
+    faculties: dict,
+) -> List[Event]:
+    """The events of column `j` of a day block, `start` is its first row."""
+    events = []
+    r = start
+    reached_end = False
+    while not reached_end:
+        reached_end = is_end_of_day(sheet, r, day, col, merged_cells)
+        v = sheet.value(r, j)
+        r += 1
+        if v is None:
+            continue
+        v = str(v)
 
-            if ev_str in spam_entries:
-                continue
+        if fix_128tt_bad_merged_cells(j, v, day, courses, faculties, periods, events):
+            continue
 
-            if not any(ch.isalpha() for ch in ev_str):
-                continue
+        ev_str = str(v).replace("\xa0", " ").replace("\n", " ").strip().upper()
 
-            ep = periods[j - 2]
+        if ev_str in DAY_ELECTIVE_CATEGORIES:
+            break
 
-            if m := search_merged_cells(merged_cells, c):
-                try:
-                    ep += periods[m - 2]
-                except:
-                    ep += periods[m - 3]
+        if ev_str in DAY_SPAM_ENTRIES:
+            continue
 
-            ev = Event.from_string(ev_str, ep, day, courses, faculties)
-            if ev is None:
-                continue
-            events.append(ev)
+        if not any(ch.isalpha() for ch in ev_str):
+            continue
+
+        ep = periods[j - 2]
+
+        if m := search_merged_cells(merged_cells, r - 1, j):
+            try:
+                ep += periods[m - 2]
+            except:
+                ep += periods[m - 3]
+
+        ev = Event.from_string(ev_str, ep, day, courses, faculties)
+        record_event(ev_str, day, ev)
+        if ev is None:
+            continue
+        events.append(ev)
 
     return events
 
 
 def parse_events(
-    sheet: Worksheet,
+    sheet: "SheetGrid | Worksheet | str",
     electives_file: str,
     row: int,
     col: int,
     faculty_map_path: str,
     curriculum_map_path: str = "curriculum.json",
+    workers: int | None = None,
 ) -> List[Event | Elective]:
-    time_row, col = get_time_row(sheet, row, col)
-    periods = get_periods(sheet, row, col, time_row)
-    merged_cells = sheet.merged_cells.sorted()
-    courses = parse_courses(sheet, row, col)
-    _ = parse_electives(electives_file)  # electives
+    sheet = as_grid(sheet)
     faculties = load_map(faculty_map_path)
     curriculum = load_map(curriculum_map_path)
-    curriculum_courses = curriculum["courses"]
-    curriculum_courses.update(courses)
-    curriculum_courses["EC112"] = "Basic Electronics for Biotechnology"
 
-    new_courses = {}
-    for k, v in courses.items():
-        new_courses.update({k[3:]: v, k: v})
-    curriculum_courses["super_secret_key"] = new_courses
+    return parse_events_with_maps(sheet, row, col, faculties, curriculum, workers)
+
 
+def parse_events_with_maps(
+    sheet: SheetGrid,
+    row: int,
+    col: int,
+    faculties: dict,
+    curriculum: dict,
+    workers: int | None = None,
+) -> List[Event | Elective]:
+    """
+    `parse_events` against already loaded faculty and curriculum maps, for
+    callers that parse many sheets with the same maps. Neither map is
+    modified.
+
+    With `workers` > 1 the day blocks are parsed concurrently in a process
+    pool. The result is the same list, in the same day and column order,
+    as a sequential parse.
+    """
+    time_row, col = get_time_row(sheet, row, col)
+    periods = get_periods(sheet, row, col, time_row)
+    return parse_day_blocks(
+        sheet,
+        row,
+        col,
+        periods,
+        get_day_starts(sheet, row, col),
+        get_subject_index(sheet, row, col, curriculum),
+        faculties,
+        workers,
+    )
+
+
+def parse_day_blocks(
+    sheet: SheetGrid,
+    row: int,
+    col: int,
+    periods: List[Period],
+    day_starts: list[tuple[int, str]],
+    curriculum_courses: "SubjectIndex",
+    faculties: dict,
+    workers: int | None = None,
+) -> List[Event | Elective]:
+    """
+    The events of every day block in `day_starts`, `col` being the last
+    column of the time row. See `parse_events_with_maps` for `workers`.
+    """
+    merged_cells = sheet.merged_index
     events = []
-    title = str(sheet.cell(1, 1).value).replace("\xa0", " ").replace("\n", " ").strip()
-    is_4th_sem = "B.Tech IV SEMESTER-EVEN SEM 2026" in title
+    parse_func = get_day_parser(sheet)
+
+    if workers is not None and workers > 1 and len(day_starts) > 1:
+        # every worker gets the sheet once, then parses whole day blocks.
+        # map() hands results back in submission order, i.e. day order
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(day_starts)),
+            initializer=_init_day_worker,
+            initargs=(
+                sheet,
+                row,
+                col,
+                periods,
+                merged_cells,
+                curriculum_courses,
+                faculties,
+            ),
+        ) as executor:
+            for day_events in executor.map(
+                _parse_day_task, [parse_func] * len(day_starts), *zip(*day_starts)
+            ):
+                events.extend(day_events)
+        return events
 
-    parse_func = parse_day_with_electives if is_4th_sem else parse_day
-    for day in days_of_the_week_names:
-        r = get_day_row(sheet, row, col, day)
-        if r < 0:
-            continue
+    for r, day in day_starts:
         events.extend(
             parse_func(
                 sheet,
@@ -1031,9 +1127,63 @@ def parse_events(
     return events
 
 
+def get_subject_index(
+    sheet: SheetGrid, row: int, col: int, curriculum: dict, courses: dict | None = None
+) -> "SubjectIndex":
+    """
+    The sheet's own course legend layered over the curriculum map. Pass
+    `courses` when the legend has been read already.
+    """
+    if courses is None:
+        courses = parse_courses(sheet, row, col)
+    curriculum_courses = dict(curriculum["courses"])
+    curriculum_courses.update(courses)
+    curriculum_courses["EC112"] = "Basic Electronics for Biotechnology"
+
+    new_courses = {}
+    for k, v in courses.items():
+        new_courses.update({k[3:]: v, k: v})
+    curriculum_courses["super_secret_key"] = new_courses
+    return SubjectIndex(curriculum_courses)
+
+
+def get_day_parser(sheet: SheetGrid):
+    title = str(sheet.value(1, 1)).replace("\xa0", " ").replace("\n", " ").strip()
+    is_4th_sem = "B.Tech IV SEMESTER-EVEN SEM 2026" in title
+
+    return parse_day_with_electives if is_4th_sem else parse_day
+
+
+def get_day_starts(sheet: SheetGrid, row: int, col: int) -> list[tuple[int, str]]:
+    """(row, day) of every day block in the sheet, in week order."""
+    day_starts = []
+    for day in days_of_the_week_names:
+        r = get_day_row(sheet, row, col, day)
+        if r < 0:
+            continue
+        day_starts.append((r, day))
+    return day_starts
+
+
+# per-process state of the day workers started by parse_events_with_maps
+_day_worker_state: tuple = ()
+
+
+def _init_day_worker(*state):
+    global _day_worker_state
+    _day_worker_state = state
+
+
+def _parse_day_task(parse_func, start: int, day: str) -> List[Event | Elective]:
+    sheet, row, col, periods, merged_cells, courses, faculties = _day_worker_state
+    return parse_func(
+        sheet, row, col, start, periods, day, merged_cells, courses, faculties
+    )
+
+
 def split_hour_min(time_str):
     if ":" in time_str or "." in time_str:
-        parts = re.split(r"[:.]", time_str)
+        parts = TIME_SEPARATOR_RE.split(time_str)
         hour = int(parts[0])
         minute = int(parts[1].strip("AMP ")) if len(parts) > 1 else 0
     else:
@@ -1061,9 +1211,7 @@ def get_teaching_assistant(input_string: str) -> tuple[str, bool]:
     if not input_string:
         return "Invalid input", False
 
-    # Pattern to match TA followed by optional hyphen and then digits
-    pattern = r"^TA-?(\d+)$"
-    match = re.match(pattern, input_string)
+    match = TEACHING_ASSISTANT_RE.match(input_string)
 
     if match:
         number = match.group(1)
@@ -1077,8 +1225,7 @@ def get_new_faculty(input_string) -> tuple[str, bool]:
     if not input_string:
         return "Invalid input", False
 
-    pattern = r"^NF(.*?)(\d+)$"
-    match = re.match(pattern, input_string)
+    match = NEW_FACULTY_RE.match(input_string)
 
     char_map = {"P": "Physics", "M": "Maths"}
 
@@ -1098,7 +1245,7 @@ def get_new_faculty(input_string) -> tuple[str, bool]:
 
 def is_classroom_code(text):
     """Check if text matches classroom code pattern {2+ chars}{number}"""
-    return bool(re.match(r"^[A-Z]{2,}\d+$", text))
+    return bool(CLASSROOM_CODE_RE.match(text))
 
 
 def is_standalone_number(text):
@@ -1144,8 +1291,7 @@ def parse_class_and_faculty(string_list: List[str]) -> tuple[str, List[str]]:
         return last_element, string_list[:-1]
 
     # Case 2: Check if last element matches {2 chars}{number} format (but not NF or TA)
-    last_element_pattern = r"^([A-Z]{2})(\d+)$"
-    match = re.match(last_element_pattern, last_element)
+    match = SHORT_CLASSROOM_CODE_RE.match(last_element)
 
     if match:
         prefix = match.group(1)
@@ -1171,7 +1317,7 @@ def check_classroom_concatenation(
 
     # First check: Look for pattern like "CL09,10" anywhere in the list
     for i, current in enumerate(string_list):
-        m = re.match(r"^([A-Z]+)(\d+(?:,\d+)+)$", current)
+        m = CLASSROOM_LIST_RE.match(current)
         if m:
             base = m.group(1)
             nums = m.group(2).split(",")
@@ -1194,7 +1340,7 @@ def check_classroom_concatenation(
             # If we found numbers after the classroom code
             if numbers:
                 # Extract the base letters from classroom code
-                match = re.match(r"^([A-Z]+)(\d+)$", current)
+                match = CLASSROOM_PARTS_RE.match(current)
                 if match:
                     base_letters = match.group(1)
                     # Build concatenated classroom string
@@ -1226,9 +1372,7 @@ def parse_classroom_teacher_format(input_string: str) -> tuple[str, str, bool]:
     if not input_string:
         return "", "", False
 
-    # Pattern: any letters followed by any digits followed by anything starting with a letter
-    pattern = r"^([A-Za-z]+)(\d+)([A-Za-z].*)$"
-    match = re.match(pattern, input_string)
+    match = CLASSROOM_TEACHER_RE.match(input_string)
 
     if match:
         chars = match.group(1)
@@ -1270,6 +1414,42 @@ def check_list_classroom_teacher_format(string_list):
     return parsed_list, all_match
 
 
+class SubjectIndex(dict):
+    """
+    Course map that memoizes subject lookups.
+
+    Built once per sheet from the merged curriculum and sheet courses
+    (including the "super_secret_key" fallback map). Plain codes are a
+    single dict hit; anything that needs `lookup_sub`'s format fixing is
+    resolved once and kept in an LRU memo, since the same codes repeat
+    hundreds of times per sheet.
+    """
+
+    def __init__(self, courses: dict, memo_size: int = 4096):
+        super().__init__(courses)
+        self._fallback = courses.get("super_secret_key") or {}
+        self._exact = {k: v for k, v in courses.items() if isinstance(v, str) and v}
+        self._resolve = functools.lru_cache(maxsize=memo_size)(self._lookup)
+
+    def __reduce__(self):
+        return (SubjectIndex, (dict(self),))
+
+    def lookup(self, code: str) -> str:
+        if (v := self._exact.get(code)) is not None:
+            return v
+        return self._resolve(code)
+
+    def _lookup(self, code: str) -> str:
+        return lookup_sub(code, self) or lookup_sub(code, self._fallback) or ""
+
+
+def lookup_subject(code: str, courses: dict) -> str:
+    """Subject name for `code`, trying the sheet's fallback map second."""
+    if isinstance(courses, SubjectIndex):
+        return courses.lookup(code)
+    return lookup_sub(code, courses) or lookup_sub(code, courses["super_secret_key"]) or ""
+
+
 def lookup_sub(subject_code, subject_dict):
     """
     Lookup subject name from potentially malformed subject code.
@@ -1309,15 +1489,15 @@ def lookup_sub(subject_code, subject_dict):
 def classify_format(code):
     """Classify the format of the subject code."""
     # Format 1: 15B11CI111 (2 digits + char + 2 digits + 2 chars + 3-4 digits)
-    if re.match(r"^\d{2}[A-Z]\d{1,2}[A-Z]{2}\d{3,4}$", code):
+    if FULL_CODE_RE.match(code):
         return 1
 
     # Format 2: B11CI111 (char + 2 digits + 2 chars + 3-4 digits)
-    if re.match(r"^[A-Z]\d{1,2}[A-Z]{2}\d{3,4}$", code):
+    if MEDIUM_CODE_RE.match(code):
         return 2
 
     # Format 3: CI111 (2 chars + 3-4 digits)
-    if re.match(r"^[A-Z]{2}\d{3,4}$", code):
+    if SHORT_CODE_RE.match(code):
         return 3
 
     return 0  # Unknown format
@@ -1326,7 +1506,7 @@ def classify_format(code):
 def fix_malformed_code(code):
     """Fix malformed full format codes and return list of possible corrections."""
     # Extract parts using regex
-    match = re.match(r"^(\d{2})([A-Z])(\d{1,2})([A-Z]{2})(\d{3,4})$", code)
+    match = FULL_CODE_PARTS_RE.match(code)
     if not match:
         return [code]
 
@@ -1408,7 +1588,7 @@ def lookup_medium_format(code, subject_dict):
 def lookup_short_format(code, subject_dict):
     """Lookup short format - direct lookup only."""
     # Fix 4 digits to 3 if needed
-    match = re.match(r"^([A-Z]{2})(\d{3,4})$", code)
+    match = SHORT_CODE_PARTS_RE.match(code)
     if match:
         chars = match.group(1)
         digits = match.group(2)
@@ -1,19 +1,24 @@
 import json
+from typing import TYPE_CHECKING
 
-import openpyxl
-from openpyxl.worksheet.worksheet import Worksheet
+from jiit_tt_parser.parser.formats import (FORMATS, LegendFormat,
+                                           extract_legends, read_pairs,
+                                           register_format)
+from jiit_tt_parser.utils.grid import SheetGrid, as_grid, load_grid
 
-from jiit_tt_parser.utils.utils import max_bounds
+if TYPE_CHECKING:
+    from openpyxl.worksheet.worksheet import Worksheet
 
 PATH = "faculty.xlsx"
 
 
-def search_bounds(sheet: Worksheet):
-    row, col = max_bounds(sheet)
+def search_bounds(sheet: "SheetGrid | Worksheet"):
+    sheet = as_grid(sheet)
+    row, col = sheet.rows, sheet.cols
 
     for i in range(1, row + 1):
         for j in range(1, col + 1):
-            if "Time Table Team" in str(sheet.cell(row=i, column=j).value):
+            if "Time Table Team" in str(sheet.value(i, j)):
                 return row, j - 1
 
     return row, col
@@ -22,8 +27,7 @@ def search_bounds(sheet: Worksheet):
 def generate_faculty_map(path: str):
     faculty_map = {}
 
-    wb = openpyxl.load_workbook(path)
-    sheet = wb.active
+    sheet = load_grid(path)
     if sheet is None:
         return faculty_map
 
@@ -31,17 +35,18 @@ def generate_faculty_map(path: str):
 
     for j in range(1, col + 1, 2):
         for i in range(1, row + 1):
-            if ((code := sheet.cell(i, j).value) is not None) and (
-                (name := sheet.cell(i, j + 1).value) is not None
+            if ((code := sheet.value(i, j)) is not None) and (
+                (name := sheet.value(i, j + 1)) is not None
             ):
                 faculty_map.update({str(code): str(name)})
 
     return faculty_map
 
 
-def parse_down(sheet: Worksheet, curr: int, curc: int):
+def parse_down(sheet: "SheetGrid | Worksheet", curr: int, curc: int):
+    sheet = as_grid(sheet)
     faculty_map = {}
-    while (v := sheet.cell(curr, curc).value) is not None:
+    while (v := sheet.value(curr, curc)) is not None:
         v = str(v)
         split_word = ":"
         if "-" in v:
@@ -70,103 +75,103 @@ def parse_down(sheet: Worksheet, curr: int, curc: int):
 
 def get_faculty_map_from_sem1(path):
     faculty_map = {}
-    wb = openpyxl.load_workbook(path)
-    sheet = wb.active
+    sheet = load_grid(path)
     if sheet is None:
         return faculty_map
 
-    row, col = max_bounds(sheet)
-    for i in range(1, row + 1):
-        for j in range(1, col + 1):
-            v = sheet.cell(i, j).value
-
-            if str(v) == "Faculty Abbreviation with Names":
-                faculty_map.update(parse_down(sheet, i + 1, j))
-
-    return faculty_map
-
-
-def parse_down_bca_N_128(sheet, r, c):
-    faculty_map = {}
-    while (v := sheet.cell(r, c).value) is not None:
-        v2 = sheet.cell(r, c + 1).value
-        faculty_map.update({str(v).strip(): str(v2).strip()})
-        r += 1
-
-    return faculty_map
-
-
-def parse_down_128_sem4(sheet, r, c):
-    faculty_map = {}
-    while (v := sheet.cell(r, c).value) is not None:
-        v2 = sheet.cell(r, c + 1).value
-        faculty_map.update({str(v2).strip(): str(v).strip()})
-        r += 1
-
-    return faculty_map
-
-
-def generate_faculty_map_from_bca1_N_128(sheet: Worksheet, row: int, col: int):
-    faculty_map = {}
-    for i in range(1, row + 1):
-        for j in range(1, col + 1):
-            v = sheet.cell(i, j).value
-
-            if str(v).strip().startswith("Faculty Abbreviation"):
-                faculty_map.update(parse_down_bca_N_128(sheet, i + 1, j))
-
-    return faculty_map
-
-
-def generate_faculty_map_from_128_sem4(sheet: Worksheet, row: int, col: int):
-    faculty_map = {}
-    for i in range(1, row + 1):
-        for j in range(1, col + 1):
-            v = sheet.cell(i, j).value
+    legends = extract_legends(sheet, formats=["faculty_lines"])
+    return legends.get("faculty", {})
+
+
+FACULTY_FORMATS = [
+    # "CODE: Name" lines under one header cell (sem 1)
+    LegendFormat(
+        "faculty_lines",
+        "faculty",
+        lambda sheet, r, c, _: parse_down(sheet, r, c),
+        signatures=((None, "Faculty Abbreviation with Names", None),),
+    ),
+    # abbreviation, name columns (bca, 128)
+    LegendFormat(
+        "faculty_pairs",
+        "faculty",
+        read_pairs(key=0, value=1),
+        prefixes=("Faculty Abbreviation",),
+    ),
+    # name, abbreviation columns (128 sem 4)
+    LegendFormat(
+        "faculty_names",
+        "faculty",
+        read_pairs(key=1, value=0),
+        prefixes=("Faculty Names",),
+    ),
+]
+for fmt in FACULTY_FORMATS:
+    register_format(fmt)
+
+
+def parse_down_bca_N_128(sheet: "SheetGrid | Worksheet", r, c):
+    return FORMATS["faculty_pairs"].extract(as_grid(sheet), r, c, r)
+
+
+def parse_down_128_sem4(sheet: "SheetGrid | Worksheet", r, c):
+    return FORMATS["faculty_names"].extract(as_grid(sheet), r, c, r)
+
+
+def generate_faculty_map_from_bca1_N_128(
+    sheet: "SheetGrid | Worksheet", row: int, col: int
+):
+    legends = extract_legends(as_grid(sheet), row, col, formats=["faculty_pairs"])
+    return legends.get("faculty", {})
 
-            if str(v).strip().startswith("Faculty Names"):
-                faculty_map.update(parse_down_128_sem4(sheet, i + 1, j))
 
-    return faculty_map
+def generate_faculty_map_from_128_sem4(
+    sheet: "SheetGrid | Worksheet", row: int, col: int
+):
+    legends = extract_legends(as_grid(sheet), row, col, formats=["faculty_names"])
+    return legends.get("faculty", {})
 
 
 def get_faculty_map_from_bca1_N_128(path):
-    wb = openpyxl.load_workbook(path)
-    sheet = wb.active
+    sheet = load_grid(path)
     if sheet is None:
         return {}
 
-    r, c = max_bounds(sheet)
+    r, c = sheet.rows, sheet.cols
     faculty_map = generate_faculty_map_from_bca1_N_128(sheet, r, c)
 
     return faculty_map
 
 
 def get_faculty_map_from_128_sem4(path):
-    wb = openpyxl.load_workbook(path)
-    sheet = wb.active
+    sheet = load_grid(path)
     if sheet is None:
         return {}
 
-    r, c = max_bounds(sheet)
+    r, c = sheet.rows, sheet.cols
     faculty_map = generate_faculty_map_from_128_sem4(sheet, r, c)
 
     return faculty_map
 
 
 def get_faculty_map(
-    fac1_xl_path: str,
-    fac2_xl_path: str,
-    sem1_xl_path: str,
-    bca1_xl_path: str,
-    fac128_xl_path: str,
+    fac1_xl_path: str | None = None,
+    fac2_xl_path: str | None = None,
+    sem1_xl_path: str | None = None,
+    bca1_xl_path: str | None = None,
+    fac128_xl_path: str | None = None,
 ):
+    """The faculty maps of the workbooks given, merged, later ones win."""
     faculty_map = {}
 
-    faculty_map.update(generate_faculty_map(fac1_xl_path))
-    faculty_map.update(get_faculty_map_from_sem1(sem1_xl_path))
-    faculty_map.update(generate_faculty_map(fac2_xl_path))
-    faculty_map.update(get_faculty_map_from_bca1_N_128(bca1_xl_path))
-    faculty_map.update(get_faculty_map_from_bca1_N_128(fac128_xl_path))
+    for loader, path in (
+        (generate_faculty_map, fac1_xl_path),
+        (get_faculty_map_from_sem1, sem1_xl_path),
+        (generate_faculty_map, fac2_xl_path),
+        (get_faculty_map_from_bca1_N_128, bca1_xl_path),
+        (get_faculty_map_from_bca1_N_128, fac128_xl_path),
+    ):
+        if path is not None:
+            faculty_map.update(loader(path))
 
     return faculty_map
@@ -0,0 +1,134 @@
+import hashlib
+from typing import List
+
+from jiit_tt_parser.parser.event_rules import get_event_rules
+from jiit_tt_parser.parser.parse_events import (Elective, Event,
+                                                get_day_first_row,
+                                                get_day_last_row,
+                                                get_day_parser, get_day_starts,
+                                                get_periods, get_subject_index,
+                                                get_time_row, parse_day,
+                                                parse_day_column,
+                                                search_merged_cells)
+from jiit_tt_parser.utils.cache import parser_version
+from jiit_tt_parser.utils.grid import SheetGrid
+
+
+def fingerprint(*parts) -> bytes:
+    """Stable digest of `parts`, comparable across processes and runs."""
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).digest()
+
+
+class ParseState:
+    """
+    What a parse leaves behind for the next one: a fingerprint of everything
+    shared by the whole sheet (periods, courses, faculty, the event rules and
+    the parser version) and, per day block column, a fingerprint of the
+    cells it reads along with its events.
+
+    `blocks` maps (day, column) to (fingerprint, events). Sheets parsed a
+    whole day block at a time use a column of None. Plain data, so a state
+    pickles next to the events it holds.
+    """
+
+    def __init__(self, context: bytes = b"", blocks: dict | None = None) -> None:
+        self.context = context
+        self.blocks: dict[tuple[str, int | None], tuple[bytes, list]] = blocks or {}
+
+
+def parse_events_incremental(
+    sheet: SheetGrid,
+    row: int,
+    col: int,
+    faculties: dict,
+    curriculum: dict,
+    previous: ParseState | None = None,
+) -> tuple[List[Event | Elective], ParseState, list[tuple[str, int | None]]]:
+    """
+    `parse_events_with_maps` that only reparses what changed since the
+    parse that left `previous`.
+
+    Each column of each day block is fingerprinted from the cell values and
+    merged spans it reads, independent of its row, so rows added above a
+    block don't invalidate it. Columns whose fingerprint is unchanged reuse
+    their events, the rest go through `parse_day_column`. A change to the
+    time row, the course legend, either map, the event rules in effect or
+    the parser's own code reparses everything.
+
+    Returns the events, in the same order as a full parse, the state for the
+    next call and the (day, column) keys that were reparsed.
+    """
+    time_row, col = get_time_row(sheet, row, col)
+    periods = get_periods(sheet, row, col, time_row)
+    merged_cells = sheet.merged_index
+    courses = get_subject_index(sheet, row, col, curriculum)
+    parse_func = get_day_parser(sheet)
+
+    context = fingerprint(
+        parser_version(),
+        get_event_rules().digest(),
+        parse_func.__name__,
+        [(p.start, p.end) for p in periods],
+        sorted(courses.items(), key=lambda kv: kv[0]),
+        sorted(faculties.items()),
+    )
+    old_blocks = {}
+    if previous is not None and previous.context == context:
+        old_blocks = previous.blocks
+
+    state = ParseState(context)
+    events = []
+    changed = []
+
+    def reuse_or_parse(key, fp, parse):
+        old = old_blocks.get(key)
+        if old is not None and old[0] == fp:
+            block_events = old[1]
+        else:
+            block_events = parse()
+            changed.append(key)
+        state.blocks[key] = (fp, block_events)
+        events.extend(block_events)
+
+    for start, day in get_day_starts(sheet, row, col):
+        first = get_day_first_row(sheet, start)
+        last = get_day_last_row(sheet, first, day, col, merged_cells)
+        column_fps = {
+            j: fingerprint(
+                [
+                    (sheet.value(r, j), search_merged_cells(merged_cells, r, j))
+                    for r in range(first, last + 1)
+                ]
+            )
+            for j in range(2, col + 1)
+        }
+
+        if parse_func is not parse_day:
+            # electives seen in one column change how later ones parse
+            reuse_or_parse(
+                (day, None),
+                fingerprint(list(column_fps.values())),
+                lambda: parse_func(
+                    sheet,
+                    row,
+                    col,
+                    start,
+                    periods,
+                    day,
+                    merged_cells,
+                    courses,
+                    faculties,
+                ),
+            )
+            continue
+
+        for j, fp in column_fps.items():
+            reuse_or_parse(
+                (day, j),
+                fp,
+                lambda: parse_day_column(
+                    sheet, col, first, j, periods, day, merged_cells, courses, faculties
+                ),
+            )
+
+    return events, state, changed
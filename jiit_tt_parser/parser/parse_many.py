@@ -0,0 +1,53 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterable, Iterator, List
+
+from jiit_tt_parser.parser.parse_events import (Elective, Event,
+                                                parse_events_with_maps)
+from jiit_tt_parser.utils.grid import as_grid
+from jiit_tt_parser.utils.utils import load_map
+
+# loaded once per worker process by _init_worker
+_faculties: dict = {}
+_curriculum: dict = {}
+
+
+def _init_worker(faculty_map_path: str, curriculum_map_path: str):
+    global _faculties, _curriculum
+    _faculties = load_map(faculty_map_path)
+    _curriculum = load_map(curriculum_map_path)
+
+
+def _parse_one(path: str) -> List[Event | Elective]:
+    sheet = as_grid(path)
+    return parse_events_with_maps(
+        sheet, sheet.rows, sheet.cols, _faculties, _curriculum
+    )
+
+
+def parse_many(
+    paths: Iterable[str],
+    faculty_map_path: str,
+    curriculum_map_path: str = "curriculum.json",
+    workers: int | None = None,
+) -> Iterator[tuple[str, List[Event | Elective]]]:
+    """
+    Parse every timetable in `paths`, fanned out over a process pool.
+
+    The faculty and curriculum maps are loaded once per worker. Yields
+    (path, events) pairs as each sheet finishes, so the order is not that
+    of `paths`. With `workers=1` everything runs in this process.
+    """
+    if workers == 1:
+        _init_worker(faculty_map_path, curriculum_map_path)
+        for path in paths:
+            yield path, _parse_one(path)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(faculty_map_path, curriculum_map_path),
+    ) as executor:
+        futures = {executor.submit(_parse_one, path): path for path in paths}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
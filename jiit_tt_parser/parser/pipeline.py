@@ -0,0 +1,145 @@
+import functools
+from typing import TYPE_CHECKING, Iterable, List
+
+import jiit_tt_parser.parser.legends  # noqa: F401, registers every legend format
+from jiit_tt_parser.parser.formats import (FORMATS, LegendTable, read_legends,
+                                           scan_legends)
+from jiit_tt_parser.parser.parse_events import (Elective, Event, Period,
+                                                get_day_starts, get_periods,
+                                                get_subject_index,
+                                                get_time_row, parse_day_blocks)
+from jiit_tt_parser.utils.grid import SheetGrid, as_grid
+from jiit_tt_parser.utils.utils import load_map
+
+if TYPE_CHECKING:
+    from openpyxl.worksheet.worksheet import Worksheet
+
+STAGES = (
+    "legends",
+    "courses",
+    "faculty",
+    "time_row",
+    "periods",
+    "days",
+    "events",
+    "electives",
+)
+
+
+class TimetablePipeline:
+    """
+    Every extraction `parse_events` and its neighbours do, as stages over a
+    single load of the workbook.
+
+    Each stage is computed the first time it is asked for, from the stages
+    it needs, and kept; stages that are never asked for never run. The
+    course and faculty legends come out of one scan (`legends`), and the
+    electives workbook is only opened for the `electives` stage.
+
+        pipeline = TimetablePipeline("tt.xlsx", "faculty.json")
+        out = pipeline.run("events", "courses")
+
+    `faculties` and `curriculum` are maps or paths of json maps. Without
+    `faculties` events resolve lecturers against the sheet's own faculty
+    legend, without `curriculum` only the sheet's course legend is used.
+
+    Stages: legends, courses, faculty (the legend maps), time_row, periods,
+    days (the row of every day block), events and electives.
+    """
+
+    def __init__(
+        self,
+        sheet: "SheetGrid | Worksheet | str",
+        faculties: dict | str | None = None,
+        curriculum: dict | str | None = None,
+        electives_file: str | None = None,
+        workers: int | None = None,
+    ) -> None:
+        self.sheet = as_grid(sheet)
+        self.row, self.col = self.sheet.rows, self.sheet.cols
+        self._faculties = faculties
+        self._curriculum = curriculum
+        self.electives_file = electives_file
+        self.workers = workers
+
+    def run(self, *stages: str) -> dict:
+        """The output of each of `stages` (just "events" if none), by name."""
+        for stage in stages:
+            if stage not in STAGES:
+                raise ValueError(f"Unknown stage: '{stage}', expected one of {STAGES}")
+        return {stage: getattr(self, stage) for stage in stages or ("events",)}
+
+    @functools.cached_property
+    def legends(self) -> List[LegendTable]:
+        return scan_legends(self.sheet, self.row, self.col)
+
+    @functools.cached_property
+    def _legend_maps(self) -> dict:
+        return read_legends(self.sheet, self.legends, self.row)
+
+    @functools.cached_property
+    def courses(self) -> dict:
+        return self._legend_maps.get("courses", {})
+
+    @functools.cached_property
+    def faculty(self) -> dict:
+        return self._legend_maps.get("faculty", {})
+
+    @functools.cached_property
+    def time_row(self) -> tuple[int, int]:
+        """The row of period times and its last column."""
+        return get_time_row(self.sheet, self.row, self.col)
+
+    @functools.cached_property
+    def periods(self) -> List[Period]:
+        time_row, col = self.time_row
+        return get_periods(self.sheet, self.row, col, time_row)
+
+    @functools.cached_property
+    def days(self) -> list[tuple[int, str]]:
+        return get_day_starts(self.sheet, self.row, self.time_row[1])
+
+    @functools.cached_property
+    def events(self) -> List[Event | Elective]:
+        col = self.time_row[1]
+        # events only see the legends within the timetable's columns
+        courses = read_legends(
+            self.sheet,
+            _of_kind(self.legends, "courses", col),
+            self.row,
+        ).get("courses", {})
+
+        curriculum = self._curriculum
+        if curriculum is None:
+            curriculum = {"courses": {}}
+        elif isinstance(curriculum, str):
+            curriculum = load_map(curriculum)
+        faculties = self._faculties
+        if faculties is None:
+            faculties = self.faculty
+        elif isinstance(faculties, str):
+            faculties = load_map(faculties)
+
+        return parse_day_blocks(
+            self.sheet,
+            self.row,
+            col,
+            self.periods,
+            self.days,
+            get_subject_index(self.sheet, self.row, col, curriculum, courses),
+            faculties,
+            self.workers,
+        )
+
+    @functools.cached_property
+    def electives(self) -> dict:
+        if self.electives_file is None:
+            raise ValueError("No electives file given to the pipeline")
+
+        from jiit_tt_parser.parser.parse_electives import parse_electives
+
+        return parse_electives(self.electives_file)
+
+
+def _of_kind(tables: Iterable[LegendTable], kind: str, col: int) -> List[LegendTable]:
+    return [t for t in tables if FORMATS[t.format].kind == kind and t.col <= col]
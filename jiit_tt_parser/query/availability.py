@@ -0,0 +1,155 @@
+from typing import Iterable, List
+
+from jiit_tt_parser.parser.parse_events import (Elective, Event, Period,
+                                                days_of_the_week_names,
+                                                parse_batches)
+from jiit_tt_parser.query.index import batch_category
+
+# the hourly columns most timetables use, when the sheet's own aren't given
+DEFAULT_PERIODS = [Period.from_minutes(h * 60, h * 60 + 50) for h in range(8, 18)]
+
+
+class Availability:
+    """
+    Occupancy bitmaps of rooms, batches and faculty over a week of periods.
+
+    Every (day, period) slot is one bit, day by day, so a room's whole week
+    is a single int and "is it free" is an AND against a query mask. Slots
+    are the sheet's `get_periods` columns when given, an event occupies
+    every slot it overlaps. Electives offered to whole batch categories
+    occupy every batch of those categories seen in the events.
+
+        free = Availability(events, periods)
+        free.free_rooms("Wednesday", Period.from_string("2:00 - 4:00 PM"))
+        free.common_free_slots(batches="A1-A10", faculty=["X"])
+    """
+
+    def __init__(
+        self,
+        events: Iterable[Event | Elective],
+        periods: List[Period] | None = None,
+        days: List[str] | None = None,
+    ) -> None:
+        self.periods = sorted(periods or DEFAULT_PERIODS, key=lambda p: p.start)
+        self.days = [d.capitalize() for d in (days or days_of_the_week_names)]
+        self._day_offsets = {d: i * len(self.periods) for i, d in enumerate(self.days)}
+        self.full = (1 << len(self.days) * len(self.periods)) - 1
+
+        self.rooms: dict[str, int] = {}
+        self.batches: dict[str, int] = {}
+        self.faculty: dict[str, int] = {}
+        # category -> slots of the electives offered to it as a whole
+        batch_cats: dict[str, int] = {}
+
+        for ev in events:
+            bits = self.mask(ev.day, ev.period)
+            if not bits:
+                continue
+            if ev.classroom:
+                self.rooms[ev.classroom] = self.rooms.get(ev.classroom, 0) | bits
+            for batch in ev.batches:
+                self.batches[batch] = self.batches.get(batch, 0) | bits
+            for name in ev.lecturer:
+                if name:
+                    self.faculty[name] = self.faculty.get(name, 0) | bits
+            if isinstance(ev, Elective):
+                for cat in ev.batch_cats:
+                    batch_cats[cat] = batch_cats.get(cat, 0) | bits
+
+        for batch in self.batches:
+            self.batches[batch] |= batch_cats.get(batch_category(batch), 0)
+        self._batch_cats = batch_cats
+
+    def mask(
+        self, day: str | None = None, between: Period | tuple[int, int] | None = None
+    ) -> int:
+        """
+        Bits of the slots on `day` (every day if None) that overlap
+        `between`, a Period or a (start, end) pair of minutes (the whole day
+        if None).
+        """
+        if between is None:
+            day_bits = (1 << len(self.periods)) - 1
+        else:
+            if isinstance(between, Period):
+                between = (between.start, between.end)
+            start, end = between
+            day_bits = 0
+            for i, p in enumerate(self.periods):
+                if p.start < end and p.end > start:
+                    day_bits |= 1 << i
+
+        if day is None:
+            return sum(day_bits << offset for offset in self._day_offsets.values())
+        offset = self._day_offsets.get(day.capitalize())
+        return 0 if offset is None else day_bits << offset
+
+    def batch_bits(self, batch: str) -> int:
+        if (bits := self.batches.get(batch)) is not None:
+            return bits
+        return self._batch_cats.get(batch_category(batch), 0)
+
+    def busy(
+        self,
+        rooms: Iterable[str] = (),
+        batches: str | Iterable[str] = (),
+        faculty: Iterable[str] = (),
+    ) -> int:
+        """
+        Slots where any of the given rooms, batches or faculty is occupied.
+        `batches` may be a batch string like "A1-A10,B3".
+        """
+        if isinstance(batches, str):
+            batches = parse_batches(batches)
+        bits = 0
+        for room in rooms:
+            bits |= self.rooms.get(room, 0)
+        for batch in batches:
+            bits |= self.batch_bits(batch)
+        for name in faculty:
+            bits |= self.faculty.get(name, 0)
+        return bits
+
+    def free_rooms(
+        self,
+        day: str | None = None,
+        between: Period | tuple[int, int] | None = None,
+        rooms: Iterable[str] | None = None,
+    ) -> List[str]:
+        """Rooms, of `rooms` or every room seen, free for all of the query."""
+        query = self.mask(day, between)
+        if rooms is None:
+            rooms = self.rooms
+        return [room for room in rooms if not self.rooms.get(room, 0) & query]
+
+    def is_free(
+        self,
+        day: str | None = None,
+        between: Period | tuple[int, int] | None = None,
+        **who,
+    ) -> bool:
+        """Whether every room, batch and faculty given (see `busy`) is free."""
+        return not self.busy(**who) & self.mask(day, between)
+
+    def common_free_slots(
+        self,
+        day: str | None = None,
+        between: Period | tuple[int, int] | None = None,
+        **who,
+    ) -> List[tuple[str, Period]]:
+        """
+        The (day, period) slots within the query where every room, batch
+        and faculty given (see `busy`) is free.
+        """
+        return self.slots(self.mask(day, between) & ~self.busy(**who))
+
+    def slots(self, bits: int) -> List[tuple[str, Period]]:
+        """The (day, period) of every set bit in `bits`."""
+        n = len(self.periods)
+        out = []
+        while bits:
+            low = bits & -bits
+            i = low.bit_length() - 1
+            out.append((self.days[i // n], self.periods[i % n]))
+            bits ^= low
+        return out
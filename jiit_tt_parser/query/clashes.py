@@ -0,0 +1,89 @@
+import heapq
+from typing import Iterable, Iterator, List, NamedTuple
+
+from jiit_tt_parser.parser.parse_events import Elective, Event
+
+KEYS = ("room", "lecturer", "batch")
+
+
+class Clash(NamedTuple):
+    key: str  # "room", "lecturer" or "batch"
+    value: str
+    day: str
+    first: Event | Elective
+    second: Event | Elective
+
+    def __str__(self) -> str:
+        return (
+            f"{self.key} {self.value} on {self.day}: "
+            f"{self.first.eventcode} ({self.first.period}) overlaps "
+            f"{self.second.eventcode} ({self.second.period})"
+        )
+
+
+def key_values(ev: Event | Elective, key: str) -> Iterable[str]:
+    if key == "room":
+        return (ev.classroom,)
+    if key == "lecturer":
+        return ev.lecturer
+    if key == "batch":
+        return ev.batches
+    raise KeyError(f"Unknown clash key: '{key}', expected one of {KEYS}")
+
+
+def find_clashes(
+    events: Iterable[Event | Elective],
+    keys: Iterable[str] = KEYS,
+    parallel_electives: bool = False,
+) -> List[Clash]:
+    """
+    Pairs of events that overlap in time on the same day while sharing a
+    room, a lecturer or a batch.
+
+    Events are bucketed per (key, value, day) and each bucket is swept once
+    in start order, keeping the still running events on a heap by end, so
+    the cost is O(n log n) plus the number of clashes found. To check many
+    sheets together pass their events chained into one iterable.
+
+    Electives running side by side for the same batch are how students pick
+    between them, so those batch overlaps are skipped unless
+    `parallel_electives` is set.
+    """
+    buckets: dict[tuple[str, str, str], list] = {}
+    for i, ev in enumerate(events):
+        for key in keys:
+            for value in dict.fromkeys(key_values(ev, key)):
+                if value:
+                    buckets.setdefault((key, value, ev.day), []).append(
+                        (ev.period.start, ev.period.end, i, ev)
+                    )
+
+    clashes = []
+    for (key, value, day), bucket in buckets.items():
+        if len(bucket) < 2:
+            continue
+        skip_electives = key == "batch" and not parallel_electives
+        for first, second in sweep(bucket):
+            if skip_electives and isinstance(first, Elective) and isinstance(
+                second, Elective
+            ):
+                continue
+            clashes.append(Clash(key, value, day, first, second))
+
+    return clashes
+
+
+def sweep(bucket: list) -> Iterator[tuple]:
+    """
+    Overlapping pairs among (start, end, i, event) intervals, each pair
+    yielded once with the earlier starting event first. Intervals that
+    only touch do not overlap.
+    """
+    bucket.sort(key=lambda t: (t[0], t[2]))
+    active: list[tuple[int, int, Event | Elective]] = []
+    for start, end, i, ev in bucket:
+        while active and active[0][0] <= start:
+            heapq.heappop(active)
+        for _, _, other in active:
+            yield other, ev
+        heapq.heappush(active, (end, i, ev))
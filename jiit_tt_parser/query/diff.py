@@ -0,0 +1,175 @@
+from typing import Iterable, List, NamedTuple
+
+from jiit_tt_parser.parser.parse_events import (Elective, Event,
+                                                days_of_the_week_names)
+
+KINDS = ("added", "removed", "moved", "room", "lecturer")
+
+DAY_ORDER = {day.capitalize(): i for i, day in enumerate(days_of_the_week_names)}
+
+
+class Change(NamedTuple):
+    kind: str  # one of KINDS
+    batch: str
+    old: Event | Elective | None
+    new: Event | Elective | None
+
+    def __str__(self) -> str:
+        ev = self.new or self.old
+        head = f"{self.kind} {self.batch or '-'} {ev.event_type} {ev.eventcode}"
+        if self.kind in ("added", "removed"):
+            return f"{head}: {ev.day} {ev.period} {ev.classroom}"
+        if self.kind == "moved":
+            return (
+                f"{head}: {self.old.day} {self.old.period} -> "
+                f"{self.new.day} {self.new.period}"
+            )
+        if self.kind == "room":
+            return f"{head}: {self.old.classroom} -> {self.new.classroom}"
+        return f"{head}: {self.old.lecturer} -> {self.new.lecturer}"
+
+
+class TimetableDiff:
+    """The changes between two parses, by kind, see `diff_timetables`."""
+
+    def __init__(self, changes: List[Change]) -> None:
+        self.changes = changes
+
+    def __iter__(self):
+        return iter(self.changes)
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def of_kind(self, kind: str) -> List[Change]:
+        return [c for c in self.changes if c.kind == kind]
+
+    @property
+    def added(self) -> List[Change]:
+        return self.of_kind("added")
+
+    @property
+    def removed(self) -> List[Change]:
+        return self.of_kind("removed")
+
+    @property
+    def moved(self) -> List[Change]:
+        return self.of_kind("moved")
+
+    @property
+    def room_changed(self) -> List[Change]:
+        return self.of_kind("room")
+
+    @property
+    def lecturer_changed(self) -> List[Change]:
+        return self.of_kind("lecturer")
+
+    def affected_batches(self) -> List[str]:
+        return list(dict.fromkeys(c.batch for c in self.changes if c.batch))
+
+
+def event_batches(ev: Event | Elective) -> List[str]:
+    """Who an event is for: its batches, else its batch categories, else ""."""
+    if ev.batches:
+        return list(dict.fromkeys(ev.batches))
+    if isinstance(ev, Elective) and ev.batch_cats:
+        return list(dict.fromkeys(ev.batch_cats))
+    return [""]
+
+
+def diff_timetables(
+    old: Iterable[Event | Elective], new: Iterable[Event | Elective]
+) -> TimetableDiff:
+    """
+    What changed, per batch, between two parses of a timetable.
+
+    Every event is entered once per batch under a (day, batch, subject,
+    type) key. Entries found under the same key on both sides are paired,
+    identical ones first, and reported as "moved" if their period changed,
+    "room" if their classroom did and "lecturer" if their lecturers did, one
+    Change per difference. What is left is paired again without the day,
+    which catches events moved to another day, and the rest is "added" or
+    "removed". Each pass is one walk over hashed buckets, so the whole diff
+    is linear in the number of events.
+    """
+    old_buckets = _bucket(old)
+    new_buckets = _bucket(new)
+
+    changes = []
+    old_left: dict[tuple, list] = {}
+    new_left: dict[tuple, list] = {}
+    for key in old_buckets.keys() | new_buckets.keys():
+        olds, news = _pair(
+            old_buckets.get(key, []), new_buckets.get(key, []), key[1], changes
+        )
+        day_less = key[1:]
+        if olds:
+            old_left.setdefault(day_less, []).extend(olds)
+        if news:
+            new_left.setdefault(day_less, []).extend(news)
+
+    for key in old_left.keys() | new_left.keys():
+        batch = key[0]
+        olds, news = _pair(old_left.get(key, []), new_left.get(key, []), batch, changes)
+        changes.extend(Change("removed", batch, ev, None) for ev in olds)
+        changes.extend(Change("added", batch, None, ev) for ev in news)
+
+    # keys come out of sets, put the report in a stable order
+    changes.sort(key=_change_order)
+    return TimetableDiff(changes)
+
+
+def _bucket(events: Iterable[Event | Elective]) -> dict[tuple, list]:
+    buckets: dict[tuple, list] = {}
+    for ev in events:
+        for batch in event_batches(ev):
+            key = (ev.day, batch, ev.eventcode, ev.event_type)
+            buckets.setdefault(key, []).append(ev)
+    return buckets
+
+
+def _signature(ev: Event | Elective) -> tuple:
+    return (ev.day, ev.period.start, ev.period.end, ev.classroom, tuple(ev.lecturer))
+
+
+def _pair(olds: list, news: list, batch: str, changes: List[Change]):
+    """
+    Pair up `olds` and `news`, appending the changes of every pair, and
+    return what is left unpaired on either side.
+    """
+    if not olds or not news:
+        return olds, news
+
+    # identical entries first, then the rest in time order
+    unmatched = {}
+    for ev in news:
+        unmatched.setdefault(_signature(ev), []).append(ev)
+    olds_left = []
+    for ev in olds:
+        same = unmatched.get(_signature(ev))
+        if same:
+            same.pop()
+        else:
+            olds_left.append(ev)
+    news_left = [ev for evs in unmatched.values() for ev in evs]
+
+    olds_left.sort(key=_time_order)
+    news_left.sort(key=_time_order)
+    n = min(len(olds_left), len(news_left))
+    for o, ne in zip(olds_left[:n], news_left[:n]):
+        if _time_order(o) != _time_order(ne):
+            changes.append(Change("moved", batch, o, ne))
+        if o.classroom != ne.classroom:
+            changes.append(Change("room", batch, o, ne))
+        if o.lecturer != ne.lecturer:
+            changes.append(Change("lecturer", batch, o, ne))
+
+    return olds_left[n:], news_left[n:]
+
+
+def _time_order(ev: Event | Elective) -> tuple:
+    return (DAY_ORDER.get(ev.day, len(DAY_ORDER)), ev.period.start, ev.period.end)
+
+
+def _change_order(c: Change) -> tuple:
+    return (KINDS.index(c.kind), c.batch, _time_order(c.new or c.old))
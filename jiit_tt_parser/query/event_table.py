@@ -0,0 +1,263 @@
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "EventTable needs numpy, install it with `pip install jiit-tt-parser[table]`"
+    ) from e
+
+from typing import Iterable, List
+
+from jiit_tt_parser.parser.parse_events import Elective, Event, Period
+
+# one code per event
+SCALAR_KEYS = ("day", "room", "subject", "event_type")
+# any number of codes per event
+RAGGED_KEYS = ("batch", "lecturer")
+
+
+class Categories:
+    """The distinct values of a column in first seen order, and their codes."""
+
+    __slots__ = ("values", "codes")
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self.codes: dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def lookup(self, want: str | Iterable[str]) -> np.ndarray:
+        """Codes of the values in `want` that occur in the column."""
+        if isinstance(want, str):
+            want = (want,)
+        codes = [self.codes[v] for v in want if v in self.codes]
+        return np.array(codes, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class Ragged:
+    """
+    A list column stored flat: the codes of row `i` are
+    `values[offsets[i]:offsets[i + 1]]` and `rows` holds the row of every code.
+    """
+
+    __slots__ = ("offsets", "values", "rows")
+
+    def __init__(self, lists: List[List[int]]) -> None:
+        lengths = np.fromiter(map(len, lists), dtype=np.int32, count=len(lists))
+        self.offsets = np.zeros(len(lists) + 1, dtype=np.int32)
+        np.cumsum(lengths, out=self.offsets[1:])
+        self.values = np.fromiter(
+            (code for codes in lists for code in codes),
+            dtype=np.int32,
+            count=int(self.offsets[-1]),
+        )
+        self.rows = np.repeat(np.arange(len(lists), dtype=np.int32), lengths)
+
+    def row(self, i: int) -> np.ndarray:
+        return self.values[self.offsets[i] : self.offsets[i + 1]]
+
+
+class EventTable:
+    """
+    Columnar copy of `parse_events` output for bulk queries.
+
+    Day, room, subject code and event type are stored as categorical codes,
+    periods as `start`/`end` minutes since midnight, and batches and
+    lecturers as ragged code lists. Filters build boolean masks over whole
+    columns and group-bys are `bincount`s, so neither touches the event
+    objects, which stay available as `events` in the same order.
+
+        table = EventTable(events)
+        table.select(room="CL15", day="Tuesday")
+        table.minutes_by("room")  # room utilization
+        table.minutes_by("lecturer", day="Monday")  # faculty load
+    """
+
+    def __init__(self, events: Iterable[Event | Elective]) -> None:
+        self.events = list(events)
+        n = len(self.events)
+
+        self.categories = {key: Categories() for key in SCALAR_KEYS + RAGGED_KEYS}
+        fields = {
+            "day": lambda ev: ev.day,
+            "room": lambda ev: ev.classroom,
+            "subject": lambda ev: ev.eventcode,
+            "event_type": lambda ev: ev.event_type,
+        }
+        self.columns: dict[str, np.ndarray] = {}
+        for key, field in fields.items():
+            code = self.categories[key].code
+            self.columns[key] = np.fromiter(
+                (code(field(ev)) for ev in self.events), dtype=np.int32, count=n
+            )
+
+        self.start = np.fromiter(
+            (ev.period.start for ev in self.events), dtype=np.int16, count=n
+        )
+        self.end = np.fromiter(
+            (ev.period.end for ev in self.events), dtype=np.int16, count=n
+        )
+        self.duration = self.end - self.start
+        self.elective = np.fromiter(
+            (isinstance(ev, Elective) for ev in self.events), dtype=bool, count=n
+        )
+
+        batch = self.categories["batch"].code
+        lecturer = self.categories["lecturer"].code
+        self.ragged = {
+            "batch": Ragged([[batch(b) for b in ev.batches] for ev in self.events]),
+            "lecturer": Ragged(
+                [[lecturer(name) for name in ev.lecturer] for ev in self.events]
+            ),
+        }
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def mask(
+        self,
+        day: str | Iterable[str] | None = None,
+        room: str | Iterable[str] | None = None,
+        subject: str | Iterable[str] | None = None,
+        event_type: str | Iterable[str] | None = None,
+        batch: str | Iterable[str] | None = None,
+        lecturer: str | Iterable[str] | None = None,
+        between: Period | tuple[int, int] | None = None,
+        elective: bool | None = None,
+    ) -> np.ndarray:
+        """
+        Boolean mask of the events matching every given filter. A filter is
+        a value or a collection of values, `between` keeps events that
+        overlap a Period or a (start, end) pair of minutes.
+        """
+        m = np.ones(len(self), dtype=bool)
+        for key, want in (
+            ("day", day),
+            ("room", room),
+            ("subject", subject),
+            ("event_type", event_type),
+        ):
+            if want is not None:
+                m &= self._isin(key, want)
+        for key, want in (("batch", batch), ("lecturer", lecturer)):
+            if want is not None:
+                m &= self._ragged_isin(key, want)
+
+        if between is not None:
+            if isinstance(between, Period):
+                between = (between.start, between.end)
+            start, end = between
+            m &= (self.start < end) & (self.end > start)
+        if elective is not None:
+            m &= self.elective == elective
+
+        return m
+
+    def indices(self, **filters) -> np.ndarray:
+        return np.flatnonzero(self.mask(**filters))
+
+    def select(self, **filters) -> List[Event | Elective]:
+        events = self.events
+        return [events[i] for i in self.indices(**filters)]
+
+    def count_by(self, key: str, **filters) -> dict[str, int]:
+        """Number of events per value of `key`, among those matching `filters`."""
+        return self._aggregate(key, None, filters)
+
+    def minutes_by(self, key: str, **filters) -> dict[str, int]:
+        """Scheduled minutes per value of `key`, among those matching `filters`."""
+        return self._aggregate(key, self.duration, filters)
+
+    def pivot(
+        self, row_key: str, col_key: str, **filters
+    ) -> tuple[List[str], List[str], np.ndarray]:
+        """
+        Scheduled minutes for every pair of `row_key` and `col_key` values,
+        e.g. `pivot("room", "day")`. Returns the row values, the column
+        values and the matrix. At most one of the keys may be a list column.
+        """
+        if row_key in RAGGED_KEYS and col_key in RAGGED_KEYS:
+            raise ValueError(f"Can't pivot two list columns: {row_key}, {col_key}")
+
+        row_codes, rows = self._expand(row_key)
+        col_codes, col_rows = self._expand(col_key)
+        if rows is None:
+            rows = col_rows
+        if rows is not None:
+            # line the scalar column up with the entries of the list column
+            if row_key in SCALAR_KEYS:
+                row_codes = row_codes[rows]
+            else:
+                col_codes = col_codes[rows]
+        else:
+            rows = slice(None)
+
+        weights = self.duration[rows]
+        if filters:
+            keep = self.mask(**filters)[rows]
+            row_codes, col_codes, weights = (
+                row_codes[keep],
+                col_codes[keep],
+                weights[keep],
+            )
+
+        n_rows = len(self.categories[row_key])
+        n_cols = len(self.categories[col_key])
+        totals = np.bincount(
+            row_codes * n_cols + col_codes, weights=weights, minlength=n_rows * n_cols
+        )
+        return (
+            self.categories[row_key].values,
+            self.categories[col_key].values,
+            totals.astype(np.int64).reshape(n_rows, n_cols),
+        )
+
+    def _expand(self, key: str) -> tuple[np.ndarray, np.ndarray | None]:
+        if key in self.ragged:
+            ragged = self.ragged[key]
+            return ragged.values, ragged.rows
+        if key in self.columns:
+            return self.columns[key], None
+        raise KeyError(f"Unknown column: '{key}'")
+
+    def _isin(self, key: str, want) -> np.ndarray:
+        codes = self.categories[key].lookup(want)
+        column = self.columns[key]
+        if len(codes) == 1:
+            return column == codes[0]
+        return np.isin(column, codes)
+
+    def _ragged_isin(self, key: str, want) -> np.ndarray:
+        ragged = self.ragged[key]
+        codes = self.categories[key].lookup(want)
+        if len(codes) == 1:
+            hits = ragged.rows[ragged.values == codes[0]]
+        else:
+            hits = ragged.rows[np.isin(ragged.values, codes)]
+        m = np.zeros(len(self), dtype=bool)
+        m[hits] = True
+        return m
+
+    def _aggregate(self, key: str, weights, filters: dict) -> dict[str, int]:
+        codes, rows = self._expand(key)
+        if rows is not None and weights is not None:
+            weights = weights[rows]
+        if filters:
+            keep = self.mask(**filters)
+            if rows is not None:
+                keep = keep[rows]
+            codes = codes[keep]
+            if weights is not None:
+                weights = weights[keep]
+
+        values = self.categories[key].values
+        totals = np.bincount(codes, weights=weights, minlength=len(values))
+        return {values[i]: int(totals[i]) for i in np.flatnonzero(totals)}
@@ -0,0 +1,108 @@
+import re
+from typing import Iterable, List
+
+from jiit_tt_parser.parser.parse_events import Elective, Event
+
+KEYS = ("batch", "faculty", "room", "subject")
+
+# "A5" -> "A", "BCA3" -> "BCA", the category an elective's batch_cats name
+BATCH_CATEGORY_RE = re.compile(r"[A-Z]+")
+
+
+def batch_category(batch: str) -> str:
+    m = BATCH_CATEGORY_RE.match(batch)
+    return m.group() if m else ""
+
+
+class EventIndex:
+    """
+    Inverted indexes over parsed events by batch, faculty, room and subject.
+
+    Each index maps a value to the positions, in `events` order, of the
+    events carrying it, so a lookup costs only as much as its result. An
+    Elective offered to whole batch categories (`batch_cats`) is listed
+    under every batch of those categories seen in the timetable, and a
+    batch that only appears through a category still finds it.
+
+    Only plain dicts, lists and the events are kept, so an index pickles
+    alongside the events it was built from.
+    """
+
+    def __init__(self, events: Iterable[Event | Elective]) -> None:
+        self.events = list(events)
+        self.indexes: dict[str, dict[str, List[int]]] = {key: {} for key in KEYS}
+        # category -> positions of the electives offered to it as a whole
+        self.batch_cats: dict[str, List[int]] = {}
+
+        batches = self.indexes["batch"]
+        faculty = self.indexes["faculty"]
+        rooms = self.indexes["room"]
+        subjects = self.indexes["subject"]
+        for i, ev in enumerate(self.events):
+            for batch in dict.fromkeys(ev.batches):
+                batches.setdefault(batch, []).append(i)
+            for name in dict.fromkeys(ev.lecturer):
+                faculty.setdefault(name, []).append(i)
+            rooms.setdefault(ev.classroom, []).append(i)
+            subjects.setdefault(ev.eventcode, []).append(i)
+            if isinstance(ev, Elective):
+                for cat in dict.fromkeys(ev.batch_cats):
+                    self.batch_cats.setdefault(cat, []).append(i)
+
+        if self.batch_cats:
+            for batch, ids in batches.items():
+                if cat_ids := self.batch_cats.get(batch_category(batch)):
+                    batches[batch] = _merge(ids, cat_ids)
+
+    def ids(self, key: str, value: str) -> List[int]:
+        """Positions in `events` of the events with `value` for `key`."""
+        try:
+            index = self.indexes[key]
+        except KeyError:
+            raise KeyError(f"Unknown index: '{key}', expected one of {KEYS}")
+
+        if (ids := index.get(value)) is not None:
+            return ids
+        if key == "batch":
+            return self.batch_cats.get(batch_category(value), [])
+        return []
+
+    def lookup(self, key: str, value: str) -> List[Event | Elective]:
+        events = self.events
+        return [events[i] for i in self.ids(key, value)]
+
+    def by_batch(self, batch: str) -> List[Event | Elective]:
+        return self.lookup("batch", batch)
+
+    def by_faculty(self, name: str) -> List[Event | Elective]:
+        return self.lookup("faculty", name)
+
+    def by_room(self, room: str) -> List[Event | Elective]:
+        return self.lookup("room", room)
+
+    def by_subject(self, code: str) -> List[Event | Elective]:
+        return self.lookup("subject", code)
+
+    def values(self, key: str) -> List[str]:
+        """Every value indexed under `key`, in first seen order."""
+        return list(self.indexes[key])
+
+
+def _merge(a: List[int], b: List[int]) -> List[int]:
+    """Union of two ascending lists of positions, ascending."""
+    merged = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i] < b[j]:
+            merged.append(a[i])
+            i += 1
+        elif b[j] < a[i]:
+            merged.append(b[j])
+            j += 1
+        else:
+            merged.append(a[i])
+            i += 1
+            j += 1
+    merged.extend(a[i:])
+    merged.extend(b[j:])
+    return merged
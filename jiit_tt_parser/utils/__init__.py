@@ -1,3 +1,15 @@
-from jiit_tt_parser.utils.utils import max_bounds, load_worksheet
+from jiit_tt_parser.utils.lazy import lazy_exports
 
 PROG = "jiit_tt_parser"
+
+# imported on first access, so importing the package doesn't load openpyxl
+_LAZY = {
+    "max_bounds": "jiit_tt_parser.utils.utils",
+    "load_worksheet": "jiit_tt_parser.utils.utils",
+    "SheetGrid": "jiit_tt_parser.utils.grid",
+    "load_grid": "jiit_tt_parser.utils.grid",
+}
+
+__all__ = ["PROG", *_LAZY]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
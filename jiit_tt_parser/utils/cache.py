@@ -0,0 +1,93 @@
+import functools
+import gzip
+import hashlib
+import os
+import pickle
+import tempfile
+
+from jiit_tt_parser.parser.event_rules import get_event_rules
+from jiit_tt_parser.utils import PROG
+
+# bump when the layout of cached entries changes
+CACHE_FORMAT = 2
+
+
+def get_cache_folder() -> str:
+    if folder := os.environ.get("JIIT_TT_CACHE"):
+        return folder
+
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, PROG)
+
+
+def ensure_cache_folder() -> str:
+    folder = get_cache_folder()
+    os.makedirs(folder, exist_ok=True)
+    return folder
+
+
+def file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def parser_version() -> str:
+    """
+    Digest of the package's own sources, so any change to the parsers
+    invalidates what they produced before.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    h = hashlib.sha256(str(CACHE_FORMAT).encode())
+    for dirpath, dirnames, filenames in sorted(os.walk(root)):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name.endswith((".py", ".json")):
+                h.update(name.encode())
+                with open(os.path.join(dirpath, name), "rb") as f:
+                    h.update(f.read())
+    return h.hexdigest()
+
+
+def cache_key(*paths: str | None) -> str:
+    """
+    Key for a parse result that depends on the contents of `paths` (None
+    for an input that wasn't given), under
+    the event rules now in effect, which may come from outside the package
+    ($JIIT_TT_EVENT_RULES or `set_event_rules`).
+    """
+    h = hashlib.sha256(parser_version().encode())
+    h.update(get_event_rules().digest().encode())
+    for path in paths:
+        h.update(b"-" if path is None else file_digest(path).encode())
+    return h.hexdigest()
+
+
+def cache_path(key: str) -> str:
+    return os.path.join(get_cache_folder(), f"{key}.pkl.gz")
+
+
+def load_cached(key: str):
+    try:
+        with gzip.open(cache_path(key), "rb") as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+
+def store_cached(key: str, entry) -> str:
+    folder = ensure_cache_folder()
+    fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path := cache_path(key))
+    except BaseException:
+        os.remove(tmp)
+        raise
+    return path
@@ -0,0 +1,32 @@
+import contextlib
+import logging
+
+# library code stays quiet unless the application configures logging
+logging.getLogger("jiit_tt_parser").addHandler(logging.NullHandler())
+
+# records of the innermost active trace_events() block, None when not tracing
+_trace: list[dict] | None = None
+
+
+@contextlib.contextmanager
+def trace_events():
+    """
+    Record how every cell parsed inside the block was interpreted.
+
+    Yields a list that receives one dict per event string, with the "raw"
+    string, the "day" and the parsed "event" (None when the string was
+    dropped). Only covers parsing done in this process, day blocks parsed
+    by worker processes are not recorded.
+    """
+    global _trace
+    outer = _trace
+    _trace = records = []
+    try:
+        yield records
+    finally:
+        _trace = outer
+
+
+def record_event(raw: str, day: str, event):
+    if _trace is not None:
+        _trace.append({"raw": raw, "day": day, "event": event})
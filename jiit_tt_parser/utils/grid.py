@@ -0,0 +1,256 @@
+import os
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+from xml.etree.ElementTree import iterparse
+
+from jiit_tt_parser.utils.utils import max_bounds
+
+# openpyxl is only imported to load a workbook, a grid can be used without it
+if TYPE_CHECKING:
+    from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+    from openpyxl.worksheet.worksheet import Worksheet
+
+
+class MergedIndex:
+    """
+    Coordinate -> merged range map, so finding the merged range of a cell
+    is a single dict lookup instead of a scan over every range.
+    """
+
+    def __init__(self, merged: list[tuple[int, int, int, int]]) -> None:
+        self.ranges: dict[tuple[int, int], tuple[int, int, int, int]] = {}
+        for rng in merged:
+            min_row, min_col, max_row, max_col = rng
+            for i in range(min_row, max_row + 1):
+                for j in range(min_col, max_col + 1):
+                    self.ranges[(i, j)] = rng
+
+    def range_for(self, row: int, col: int) -> tuple[int, int, int, int] | None:
+        return self.ranges.get((row, col))
+
+    def is_merged(self, row: int, col: int) -> bool:
+        """True for the cells openpyxl represents as `MergedCell`, i.e. every
+        cell of a merged range except its top-left one."""
+        r = self.ranges.get((row, col))
+        return r is not None and (r[0], r[1]) != (row, col)
+
+    def same_group(self, cell1: tuple[int, int], cell2: tuple[int, int]) -> bool:
+        r = self.ranges.get(cell1)
+        return r is not None and r == self.ranges.get(cell2)
+
+
+class SheetGrid:
+    """
+    Dense, read-only snapshot of a worksheet.
+
+    Holds the cell values as a list of row tuples together with the merged
+    ranges and the fill themes the parsers look at, so parsing never has to
+    go back to openpyxl's object model. Coordinates are 1-based like
+    openpyxl's and anything outside the bounds reads as None.
+    """
+
+    def __init__(
+        self,
+        values: list[tuple],
+        merged: list[tuple[int, int, int, int]] | None = None,
+        themes: dict[tuple[int, int], int] | None = None,
+    ) -> None:
+        self.rows = len(values)
+        self.cols = max((len(v) for v in values), default=0)
+        self.values = [tuple(v) + (None,) * (self.cols - len(v)) for v in values]
+        # (min_row, min_col, max_row, max_col) of every merged range
+        self.merged = merged or []
+        # (row, col) -> fill theme, only for cells that have one
+        self.themes = themes or {}
+        self._empty_row = (None,) * self.cols
+        self._merged_index: MergedIndex | None = None
+
+    @classmethod
+    def from_worksheet(cls, sheet: "Worksheet", theme_cols: tuple[int, ...] = (1,)):
+        row, col = max_bounds(sheet)
+        values = [[None] * col for _ in range(row)]
+        themes = {}
+        # walk only the cells openpyxl holds, empty coordinates stay None
+        for (i, j), cell in sheet._cells.items():
+            if (v := cell.value) is not None:
+                values[i - 1][j - 1] = v
+            if j in theme_cols:
+                theme = cell.fill.start_color.theme
+                if isinstance(theme, int):
+                    themes[(i, j)] = theme
+
+        merged = [
+            (r.min_row, r.min_col, r.max_row, r.max_col)
+            for r in sheet.merged_cells.sorted()
+        ]
+
+        return cls(values, merged, themes)
+
+    @classmethod
+    def from_read_only(
+        cls, sheet: "ReadOnlyWorksheet", theme_cols: tuple[int, ...] = (1,)
+    ):
+        """
+        Build a grid from a worksheet opened with `read_only=True`.
+
+        Values are streamed once. Read-only worksheets expose neither merged
+        ranges nor per-cell fills, so those come from a second, lightweight
+        pass over the sheet xml that only looks at merge refs and the style
+        ids of the `theme_cols` cells.
+        """
+        sheet.reset_dimensions()  # don't trust the dimension tag, read it all
+        values = []
+        row, col = 1, 1
+        for i, values_row in enumerate(sheet.iter_rows(values_only=True), start=1):
+            values.append(values_row)
+            for j in range(len(values_row), 0, -1):
+                if values_row[j - 1] is not None:
+                    row = i
+                    if j > col:
+                        col = j
+                    break
+        values = [list(v[:col]) for v in values[:row]] or [[None]]
+
+        merged, style_ids = _scan_merges_and_styles(sheet, theme_cols)
+
+        # full mode drops the values hidden under a merged range, so do we
+        for min_row, min_col, max_row, max_col in merged:
+            for i in range(min_row, min(max_row, row) + 1):
+                for j in range(min_col, min(max_col, col) + 1):
+                    if (i, j) != (min_row, min_col) and j <= len(values[i - 1]):
+                        values[i - 1][j - 1] = None
+
+        wb = sheet.parent
+        themes = {}
+        for coord, style_id in style_ids.items():
+            fill = wb._fills[wb._cell_styles[style_id].fillId]
+            theme = fill.start_color.theme
+            if isinstance(theme, int):
+                themes[coord] = theme
+
+        return cls(values, merged, themes)
+
+    def value(self, row: int, col: int):
+        if 0 < row <= self.rows and 0 < col <= self.cols:
+            return self.values[row - 1][col - 1]
+        return None
+
+    def row(self, row: int) -> tuple:
+        if 0 < row <= self.rows:
+            return self.values[row - 1]
+        return self._empty_row
+
+    def is_empty_row(self, row: int, cols: int) -> bool:
+        return all(v is None for v in self.row(row)[:cols])
+
+    def fill_theme(self, row: int, col: int) -> int | None:
+        return self.themes.get((row, col))
+
+    @property
+    def merged_index(self) -> MergedIndex:
+        if self._merged_index is None:
+            self._merged_index = MergedIndex(self.merged)
+        return self._merged_index
+
+    def merged_range(self, row: int, col: int) -> tuple[int, int, int, int] | None:
+        return self.merged_index.range_for(row, col)
+
+    def is_merged(self, row: int, col: int) -> bool:
+        return self.merged_index.is_merged(row, col)
+
+
+def _scan_merges_and_styles(
+    sheet: "ReadOnlyWorksheet", theme_cols: tuple[int, ...]
+) -> tuple[list[tuple[int, int, int, int]], dict[tuple[int, int], int]]:
+    from openpyxl.utils.cell import column_index_from_string, coordinate_from_string
+    from openpyxl.worksheet.cell_range import CellRange
+
+    merged = []
+    style_ids = {}
+    with sheet._get_source() as src:
+        for _, el in iterparse(src):
+            tag = el.tag.rpartition("}")[2]
+            if tag == "c":
+                ref, style_id = el.get("r"), el.get("s")
+                if ref and style_id:
+                    letters, i = coordinate_from_string(ref)
+                    j = column_index_from_string(letters)
+                    if j in theme_cols:
+                        style_ids[(i, j)] = int(style_id)
+            elif tag == "row":
+                el.clear()
+            elif tag == "mergeCell":
+                merged.append(CellRange(el.get("ref")))
+
+    merged.sort(key=lambda r: (r.min_col, r.min_row, r.max_col, r.max_row))
+    return [(r.min_row, r.min_col, r.max_row, r.max_col) for r in merged], style_ids
+
+
+# workbooks whose grids load_grid keeps, least recently used ones go first
+GRID_CACHE_SIZE = 8
+
+# realpath -> ((mtime, size, read_only), grid), only the latest version is kept
+_grid_cache: OrderedDict[str, tuple[tuple[int, int, bool], SheetGrid | None]] = (
+    OrderedDict()
+)
+
+
+def clear_grid_cache():
+    _grid_cache.clear()
+
+
+def as_grid(sheet: "SheetGrid | Worksheet | ReadOnlyWorksheet | str") -> SheetGrid:
+    if isinstance(sheet, SheetGrid):
+        return sheet
+    if isinstance(sheet, str):
+        grid = load_grid(sheet)
+        if grid is None:
+            raise ValueError(f"Workbook has no active sheet: '{sheet}'")
+        return grid
+
+    from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+
+    if isinstance(sheet, ReadOnlyWorksheet):
+        return SheetGrid.from_read_only(sheet)
+    return SheetGrid.from_worksheet(sheet)
+
+
+def load_grid(
+    path: str, read_only: bool = True, use_cache: bool = True
+) -> SheetGrid | None:
+    """
+    Load the active sheet of the workbook at `path` as a `SheetGrid`.
+
+    By default the workbook is streamed in read-only mode, so load time and
+    memory scale with the cells that hold content rather than with the full
+    openpyxl object model. Pass `read_only=False` to go through a regular
+    in-memory worksheet instead.
+
+    Grids are cached per process, keyed by the file's path, mtime and size,
+    so a workbook used for events, courses and faculty is only loaded once.
+    Only the `GRID_CACHE_SIZE` most recently used workbooks are kept, so a
+    long running process doesn't hold on to every workbook it has seen.
+    The returned grid is shared between callers and must not be modified.
+    """
+    real = os.path.realpath(path)
+    st = os.stat(real)
+    key = (st.st_mtime_ns, st.st_size, read_only)
+    if use_cache and (hit := _grid_cache.get(real)) is not None and hit[0] == key:
+        _grid_cache.move_to_end(real)
+        return hit[1]
+
+    import openpyxl
+
+    wb = openpyxl.load_workbook(real, read_only=read_only)
+    try:
+        sheet = wb.active
+        grid = None if sheet is None else as_grid(sheet)
+    finally:
+        wb.close()
+
+    if use_cache:
+        _grid_cache[real] = (key, grid)
+        _grid_cache.move_to_end(real)
+        while len(_grid_cache) > GRID_CACHE_SIZE:
+            _grid_cache.popitem(last=False)
+    return grid
@@ -0,0 +1,27 @@
+import importlib
+import sys
+
+
+def lazy_exports(module_name: str, exports: dict[str, str]):
+    """
+    Module `__getattr__` and `__dir__` (PEP 562) for a package whose
+    `exports` (name -> module it comes from) are only imported on first
+    access. A name resolved once is set on the package, so later lookups
+    don't come back here.
+
+        __getattr__, __dir__ = lazy_exports(__name__, {"load_grid": ...})
+    """
+    package = sys.modules[module_name]
+
+    def __getattr__(name: str):
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        setattr(package, name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(package)) | set(exports))
+
+    return __getattr__, __dir__
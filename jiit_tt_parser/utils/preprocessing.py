@@ -0,0 +1,71 @@
+import json
+import os
+
+from jiit_tt_parser.parser.parse_faculty import get_faculty_map
+from jiit_tt_parser.parser.pipeline import TimetablePipeline
+from jiit_tt_parser.query.index import EventIndex
+from jiit_tt_parser.utils.cache import (cache_key, ensure_cache_folder,
+                                        load_cached, store_cached)
+from jiit_tt_parser.utils.utils import load_map
+
+
+def parse_events_cached(
+    tt_path: str,
+    faculty_map_path: str | None = None,
+    curriculum_map_path: str | None = None,
+) -> dict:
+    """
+    `parse_events` backed by the on-disk cache.
+
+    Returns a dict with the parsed "events", an `EventIndex` over them as
+    "index", and the "courses" and "faculties" maps they were resolved
+    against. Entries are keyed by the contents of the timetable, faculty
+    and curriculum files and by the parser version, so an unchanged
+    timetable is a single file read. Without a faculty or curriculum map
+    the sheet's own legends are used.
+    """
+    key = cache_key(tt_path, faculty_map_path, curriculum_map_path)
+    if (entry := load_cached(key)) is not None:
+        return entry
+
+    faculties = None if faculty_map_path is None else load_map(faculty_map_path)
+    pipeline = TimetablePipeline(tt_path, faculties, curriculum_map_path)
+    entry = pipeline.run("events", "courses")
+    entry["index"] = EventIndex(entry["events"])
+    entry["faculties"] = pipeline.faculty if faculties is None else faculties
+    store_cached(key, entry)
+    return entry
+
+
+def cache_tt_xls(
+    tt_paths: list[str],
+    faculty_map_path: str | None = None,
+    curriculum_map_path: str | None = None,
+):
+    ensure_cache_folder()
+    for path in tt_paths:
+        entry = parse_events_cached(path, faculty_map_path, curriculum_map_path)
+        print(f"{path}: {len(entry['events'])} events")
+
+
+def cache_fac(
+    fac1_xl_path: str | None = None,
+    fac2_xl_path: str | None = None,
+    sem1_xl_path: str | None = None,
+    bca1_xl_path: str | None = None,
+    fac128_xl_path: str | None = None,
+    out_path: str | None = None,
+) -> str:
+    """
+    Build the faculty map from the workbooks given and write it as the json
+    `parse_events` reads.
+    """
+    out_path = out_path or os.path.join(ensure_cache_folder(), "faculty.json")
+    faculty_map = get_faculty_map(
+        fac1_xl_path, fac2_xl_path, sem1_xl_path, bca1_xl_path, fac128_xl_path
+    )
+    with open(out_path, "w") as f:
+        json.dump(faculty_map, f, indent=2, ensure_ascii=False)
+
+    print(f"{out_path}: {len(faculty_map)} faculty")
+    return out_path
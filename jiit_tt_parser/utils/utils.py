@@ -1,25 +1,41 @@
-from openpyxl.worksheet.worksheet import Worksheet
-from openpyxl.cell.cell import Cell
-import openpyxl
-import requests
 import json
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from openpyxl.cell.cell import Cell
+    from openpyxl.worksheet.worksheet import Worksheet
 
 
-def max_bounds(sheet: Worksheet) -> tuple[int, int]:
-    row, col = sheet.max_row, sheet.max_column
+
+def max_bounds(sheet: "Worksheet") -> tuple[int, int]:
+    """
+    Tight (row, column) bounds of the cells that hold a value.
+
+    Only walks cells that actually exist, so empty coordinates are never
+    materialized. Read-only worksheets have no cell store and are streamed
+    row by row instead.
+    """
     r, c = 1, 1
-    for i in range(1, row+1):
-        for j in range(1, col+1):
-            value = sheet.cell(row=i, column=j).value
-            if value is not None:
-                if i > r:
+    cells = getattr(sheet, "_cells", None)
+    if cells is None:
+        for i, values in enumerate(sheet.iter_rows(values_only=True), start=1):
+            for j in range(len(values), 0, -1):
+                if values[j - 1] is not None:
                     r = i
-                if j > c:
-                    c = j
+                    if j > c:
+                        c = j
+                    break
+        return r, c
+
+    for (i, j), cell in cells.items():
+        if cell.value is not None:
+            if i > r:
+                r = i
+            if j > c:
+                c = j
     return r,c
 
-def print_worksheet(sheet: Worksheet, row: int, column: int):
+def print_worksheet(sheet: "Worksheet", row: int, column: int):
     print("|", end="")
     for i in range(1, row+1):
         for j in range(1, column+1):
@@ -29,7 +45,7 @@ def print_worksheet(sheet: Worksheet, row: int, column: int):
 
     print("|", end="")
 
-def is_empty_row(sheet: Worksheet, row: int, cols: int):
+def is_empty_row(sheet: "Worksheet", row: int, cols: int):
     for i in range(1, cols+1):
         if sheet.cell(row, i).value is not None:
             return False
@@ -38,6 +54,8 @@ def is_empty_row(sheet: Worksheet, row: int, cols: int):
 
 
 def download(url: str, save_as: str, block_size: int = 1024*10):
+    import requests
+
     r = requests.get(url, stream=True)
     size = r.headers.get("Content-Length") or r.headers.get("content-length")
     
@@ -47,7 +65,9 @@ def download(url: str, save_as: str, block_size: int = 1024*10):
     
     return size
 
-def load_worksheet(path: str) -> tuple[Worksheet, int, int] | None:
+def load_worksheet(path: str) -> "tuple[Worksheet, int, int] | None":
+    import openpyxl
+
     wb = openpyxl.load_workbook(path)
     sheet = wb.active
     if sheet is None:
@@ -57,7 +77,9 @@ def load_worksheet(path: str) -> tuple[Worksheet, int, int] | None:
     return sheet, r, c
 
 
-def are_cells_in_same_merged_group(worksheet: Worksheet, cell1: Cell, cell2: Cell):
+def are_cells_in_same_merged_group(
+    worksheet: "Worksheet", cell1: "Cell", cell2: "Cell"
+):
     """
     Check if two openpyxl cell objects are part of the same merged cells group.
     
@@ -86,7 +108,7 @@ def are_cells_in_same_merged_group(worksheet: Worksheet, cell1: Cell, cell2: Cel
     return False
 
 # Helper function to find which merged group a cell belongs to (if any)
-def get_merged_range_for_cell(worksheet: Worksheet, cell: Cell):
+def get_merged_range_for_cell(worksheet: "Worksheet", cell: "Cell"):
     """
     Find the merged range that contains the given cell object.
     
@@ -7,6 +7,7 @@ import sys
 # from openpyxl.worksheet.cell_range import CellRange
 
 from jiit_tt_parser.utils.utils import cvt_xls_to_xlsx, max_bounds, print_worksheet
+from jiit_tt_parser.utils.grid import load_grid
 # from parser.parse_courses import parse_courses
 from jiit_tt_parser.parser.parse_events import parse_events
 
@@ -19,13 +20,12 @@ if __name__ == "__main__":
 
     PATH = os.path.join(tempfile.gettempdir(), "cec.xlsx")
     shutil.copyfile(TT_PATH, PATH)
-    wb = openpyxl.load_workbook(PATH)
-    sheet = wb.active
-    r, c = max_bounds(sheet)
+    sheet = load_grid(PATH)
+    r, c = sheet.rows, sheet.cols
     # print_worksheet(sheet, r, c)
     # p(sheet, r,c )
     for i in range(1, r+1):
-        print(sheet.cell(i, 1).value)
+        print(sheet.value(i, 1))
     from pprint import pprint
     # pprint(parse_courses(sheet, r, c))
     # pprint(get_faculty_map("./faculty.xlsx", "./ttsem1.xlsx"))
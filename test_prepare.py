@@ -1,10 +1,11 @@
 from jiit_tt_parser.utils.preprocessing import cache_tt_xls, cache_fac
 from jiit_tt_parser.utils.cache import ensure_cache_folder
-from jiit_tt_parser.utils.utils import cvt_xls_to_xlsx
+
+TT_PATHS = ["bca_sem_1_3_new.xlsx"]
 
 
 if __name__ == "__main__":
     ensure_cache_folder()
-    cache_tt_xls()
+    faculty_map_path = cache_fac(bca1_xl_path="bca_sem_1_3_new.xlsx")
     print()
-    cache_fac()
+    cache_tt_xls(TT_PATHS, faculty_map_path)
@@ -0,0 +1,26 @@
+from jiit_tt_parser.parser.parse_events import (Event, Period, SubjectIndex,
+                                                fix_128tt_bad_merged_cells)
+from jiit_tt_parser.query.clashes import find_clashes
+from jiit_tt_parser.query.index import EventIndex
+
+PERIODS = [Period.from_minutes(540 + 60 * i, 600 + 60 * i) for i in range(8)]
+
+
+def test_split_cell_skips_dropped_events():
+    events = []
+    split = fix_128tt_bad_merged_cells(
+        3,
+        "LA1(CS111)-CR1/X LA2(CS112)-NF1 (DSH)",
+        "Monday",
+        SubjectIndex({"super_secret_key": {}}),
+        {},
+        PERIODS,
+        events,
+    )
+
+    assert split
+    assert len(events) == 1
+    assert all(isinstance(ev, Event) for ev in events)
+    # what parse_events returns is safe to query
+    assert find_clashes(events) == []
+    EventIndex(events)
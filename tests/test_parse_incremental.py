@@ -0,0 +1,46 @@
+from jiit_tt_parser.parser.event_rules import (EventRules, get_event_rules,
+                                               set_event_rules)
+from jiit_tt_parser.parser.parse_incremental import parse_events_incremental
+from jiit_tt_parser.utils.grid import SheetGrid
+
+# a time row and one monday block of two columns
+SHEET = SheetGrid(
+    [
+        ("", "9:00 - 9:50 AM", "10:00 - 10:50 AM"),
+        ("MON", "LA1(CS111)-CR1/X", "LA2(CS112)-CR2/Y"),
+    ]
+)
+
+
+def parse(previous=None):
+    return parse_events_incremental(
+        SHEET, SHEET.rows, SHEET.cols, {}, {"courses": {}}, previous
+    )
+
+
+def test_unchanged_sheet_reuses_every_block():
+    events, state, changed = parse()
+    assert changed
+
+    again, _, changed = parse(state)
+    assert changed == []
+    assert again == events
+
+
+def test_new_event_rules_reparse_everything():
+    events, state, _ = parse()
+    rules = get_event_rules()
+    try:
+        set_event_rules(
+            EventRules(
+                rules.electives,
+                rules.fixups + [{"find": "CR2/Y", "replace": "CR3/Y"}],
+            )
+        )
+        reparsed, _, changed = parse(state)
+    finally:
+        set_event_rules(None)
+
+    assert len(changed) == len(state.blocks)
+    assert [ev.classroom for ev in events] == ["CR1", "CR2"]
+    assert [ev.classroom for ev in reparsed] == ["CR1", "CR3"]